@@ -6,17 +6,27 @@ Provides common functionality for all system agents.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type
 from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
+import asyncio
 import os
 import uuid
 import yaml
 import json
 import logging
+import openai
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential
+)
 from backend.config.settings import settings, ModelConfig
-from backend.db.models.serialization import serialize_dict, prepare_for_db
+from backend.db.models.serialization import serialize_dict, prepare_for_db, dumps_for_log
 
 # LangChain imports
 from langchain.output_parsers import PydanticOutputParser
@@ -26,6 +36,35 @@ from langchain.schema.runnable import RunnablePassthrough
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml's C loader when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# LLM API failures worth resending unchanged (APITimeoutError is an
+# APIConnectionError); anything else goes back to the model as feedback
+LLM_RETRY_ERRORS = (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+LLM_RETRY_ATTEMPTS = 4
+LLM_RETRY_WAIT = wait_random_exponential(multiplier=1, max=30)
+
+
+async def _ainvoke_with_backoff(chain) -> Any:
+    """Invoke a chain, retrying transient API failures with jittered backoff"""
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(LLM_RETRY_ATTEMPTS),
+        wait=LLM_RETRY_WAIT,
+        retry=retry_if_exception_type(LLM_RETRY_ERRORS),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    ):
+        with attempt:
+            return await chain.ainvoke({})
+
+
+@lru_cache(maxsize=64)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached per (path, mtime) so edits are picked up"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 
 class AgentConfig(BaseModel):
     """Base configuration for all agents"""
@@ -113,9 +152,10 @@ class BaseAgent(ABC):
         initiative_config_path = f"initiatives/{self.config.initiative_id}/config.yaml"
         
         if os.path.exists(initiative_config_path):
-            with open(initiative_config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-                model_provider = config_data.get("model_provider", self.config.model_provider)
+            config_data = _load_yaml(
+                initiative_config_path, os.stat(initiative_config_path).st_mtime_ns
+            )
+            model_provider = config_data.get("model_provider", self.config.model_provider)
         else:
             model_provider = self.config.model_provider
         
@@ -240,8 +280,9 @@ class BaseAgent(ABC):
                 "statistics": fresh_context.get("statistics", {})
             }
             
-            # Build prompts with fresh data
-            system_prompt = self.get_system_prompt()
+            # Build prompts with fresh data (prompt builders read prompt
+            # files from disk, so keep that off the event loop)
+            system_prompt = await asyncio.to_thread(self.get_system_prompt)
             user_prompt = self.build_user_prompt(enhanced_input, error_feedback)
             
             # Add format instructions
@@ -263,10 +304,11 @@ class BaseAgent(ABC):
             try:
                 # Execute the chain
                 logger.info(f"Calling LLM for {self.config.name}...")
-                output = chain.invoke({})
+                output = await _ainvoke_with_backoff(chain)
                 
-                logger.debug(f"Output: {output}")
-                logger.debug(f"Output type: {type(output)}")
+                # Only serialize the (large) output when debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Output ({type(output).__name__}): {dumps_for_log(output)}")
                 
                 # Convert to dict if it's a Pydantic model
                 if isinstance(output, BaseModel):
@@ -6,7 +6,7 @@ from pydantic import BaseModel
 from agents.base.agent import BaseAgent, AgentConfig
 from agents.content_creator.models import ContentBatch
 from agents.content_creator.prompt_builder import ContentCreatorPromptBuilder
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 from agents.guardrails.state import ContentGenerationState, InitiativeGenerationState
 from backend.config.settings import settings
 from agents.content_creator.tools.posting_service import PostingService
@@ -19,7 +19,7 @@ class ContentCreatorAgent(BaseAgent):
     """Content creator with structured output and guardrails"""
     
     def __init__(self, config: AgentConfig):
-        self.db_client = DatabaseClient(initiative_id=config.initiative_id)
+        self.db_client = get_pooled_client(config.initiative_id)
         self.prompt_builder = ContentCreatorPromptBuilder(config.initiative_id)
         self.generation_state = None  # Injected by orchestrator
         self.tools_by_ad_set = {}
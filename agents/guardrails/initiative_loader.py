@@ -5,9 +5,8 @@ Provides a single source of truth for all guardrail validations.
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 import logging
-import traceback
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +16,7 @@ class InitiativeLoader:
     
     def __init__(self, initiative_id: str):
         self.initiative_id = initiative_id
-        self.db_client = DatabaseClient(initiative_id=initiative_id)
+        self.db_client = get_pooled_client(initiative_id)
         self._cache = None
         self._cache_timestamp = None
         self.cache_duration = 300  # 5 minutes cache
@@ -83,8 +82,7 @@ class InitiativeLoader:
             return context
             
         except Exception as e:
-            logger.error(f"Failed to load initiative context: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Failed to load initiative context: {e}")
             
             # Return a minimal valid context structure on error
             return self._get_empty_context()
@@ -120,6 +118,11 @@ class InitiativeLoader:
             "loaded_at": datetime.now(timezone.utc).isoformat()
         }
     
+    def clear_cache(self):
+        """Drop cached context so the next load hits the database"""
+        self._cache = None
+        self._cache_timestamp = None
+    
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid"""
         if not self._cache or not self._cache_timestamp:
@@ -257,8 +260,7 @@ class InitiativeLoader:
                         "published_posts": sum(1 for p in posts if p.get("is_published"))
                     }
                 except Exception as e:
-                    logger.error(f"Error counting content for ad set {ad_set['id']}: {e}")
-                    logger.error(f"Traceback: {traceback.format_exc()}")
+                    logger.exception(f"Error counting content for ad set {ad_set['id']}: {e}")
                     ad_set["content_counts"] = {
                         "total_posts": 0,
                         "facebook_posts": 0,
@@ -272,8 +274,7 @@ class InitiativeLoader:
             return ad_sets
             
         except Exception as e:
-            logger.error(f"Error loading ad sets: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error loading ad sets: {e}")
             return []
     
     async def _load_posts(self) -> List[Dict[str, Any]]:
@@ -311,8 +312,7 @@ class InitiativeLoader:
             return posts
             
         except Exception as e:
-            logger.error(f"Error loading posts: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error loading posts: {e}")
             return []
     
     async def _load_media_files(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -468,8 +468,7 @@ class InitiativeLoader:
             }
             
         except Exception as e:
-            logger.error(f"Error calculating statistics: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error calculating statistics: {e}")
             
             # Return valid empty statistics on error
             return {
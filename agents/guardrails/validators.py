@@ -238,9 +238,7 @@ class PlannerValidator(BaseValidator):
             return True, None
             
         except Exception as e:
-            logger.error(f"Planner validation error: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Planner validation error: {e}")
             return False, f"Validation failed: {str(e)}"
     
     def _would_be_active(self, entity: Dict[str, Any], now: datetime) -> bool:
@@ -11,7 +11,7 @@ from agents.researcher.agent import ResearchAgent
 from agents.content_creator.agent import ContentCreatorAgent
 from agents.guardrails.initiative_loader import InitiativeLoader
 from agents.guardrails.state import InitiativeGenerationState
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 from backend.config.settings import settings
 import logging
 import uuid
@@ -79,17 +79,22 @@ class OrchestratorAgent:
         self.config = config
         self.agent_id = str(uuid.uuid4())
         self.workflow = workflow
-        self.workflow_id = str(uuid.uuid4())
-        self.execution_id = str(uuid.uuid4())
-        self.db_client = DatabaseClient(initiative_id=config.initiative_id)
+        self.db_client = get_pooled_client(config.initiative_id)
         self.prompt_builder = OrchestratorPromptBuilder(config.initiative_id)
         self.initiative_loader = InitiativeLoader(config.initiative_id)
-        self.initiative_context = None
-        self.generation_state = None
+        self.reset_state()
         
         if workflow not in self.WORKFLOWS:
             raise ValueError(f"Unknown workflow: {workflow}")
     
+    def reset_state(self):
+        """Reset per-run state so the orchestrator can be reused for another run"""
+        self.workflow_id = str(uuid.uuid4())
+        self.execution_id = str(uuid.uuid4())
+        self.initiative_context = None
+        self.generation_state = None
+        self.initiative_loader.clear_cache()
+    
     def get_system_prompt(self) -> str:
         """Delegate to prompt builder"""
         return self.prompt_builder.get_system_prompt(self.workflow)
@@ -6,7 +6,7 @@ from pydantic import BaseModel
 from agents.base.agent import BaseAgent, AgentConfig
 from agents.planner.models import PlannerOutput
 from agents.planner.prompt_builder import PlannerPromptBuilder
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 from agents.guardrails.validators import PlannerValidator
 from agents.guardrails.initiative_loader import InitiativeLoader
 from backend.config.settings import settings
@@ -21,7 +21,7 @@ class PlanningAgent(BaseAgent):
     """Planning agent with structured output and guardrails"""
     
     def __init__(self, config: AgentConfig):
-        self.db_client = DatabaseClient(initiative_id=config.initiative_id)
+        self.db_client = get_pooled_client(config.initiative_id)
         self.prompt_builder = PlannerPromptBuilder(config.initiative_id)
         self.validator = PlannerValidator()
         self.initiative_loader = InitiativeLoader(config.initiative_id)
@@ -177,7 +177,10 @@ class PlanningAgent(BaseAgent):
         """Save validated campaign plan to database and return saved records"""
         logger.info("Saving new campaign plan...")
         
-        saved_campaigns = []
+        # Build every row up front (IDs are generated client-side) so the
+        # whole hierarchy is written with one bulk insert per table
+        campaign_entries = []
+        ad_set_entries = []
         
         for campaign_data in plan.get("campaigns", []):
             # Generate proper UUID for campaign
@@ -187,8 +190,7 @@ class PlanningAgent(BaseAgent):
             budget = campaign_data.get("budget", {})
             schedule = campaign_data.get("schedule", {})
             
-            # Save campaign
-            campaign_entry = {
+            campaign_entries.append({
                 "id": campaign_id,
                 "initiative_id": self.config.initiative_id,
                 "name": campaign_data.get("name"),
@@ -200,30 +202,17 @@ class PlanningAgent(BaseAgent):
                 "start_date": schedule.get("start_date") if isinstance(schedule, dict) else None,
                 "end_date": schedule.get("end_date") if isinstance(schedule, dict) else None,
                 "execution_id": self.execution_id
-            }
-            
-            saved_campaign = await self.db_client.insert("campaigns", campaign_entry)
+            })
             
-            # Build the campaign structure for Content Creator
-            campaign_with_ad_sets = {
-                "id": saved_campaign["id"],
-                "name": saved_campaign["name"],
-                "objective": saved_campaign["objective"],
-                "ad_sets": []
-            }
-            
-            # Save ad sets for this campaign
             for ad_set_data in campaign_data.get("ad_sets", []):
-                ad_set_id = str(uuid.uuid4())
-                
                 # Extract nested data properly
                 target_audience = ad_set_data.get("target_audience", {})
                 creative_brief = ad_set_data.get("creative_brief", {})
                 materials = ad_set_data.get("materials", {})
                 ad_set_budget = ad_set_data.get("budget", {})
                 
-                ad_set_entry = {
-                    "id": ad_set_id,
+                ad_set_entries.append({
+                    "id": str(uuid.uuid4()),
                     "campaign_id": campaign_id,
                     "initiative_id": self.config.initiative_id,
                     "name": ad_set_data.get("name"),
@@ -237,25 +226,36 @@ class PlanningAgent(BaseAgent):
                     "daily_budget": ad_set_budget.get("daily") if isinstance(ad_set_budget, dict) else None,
                     "lifetime_budget": ad_set_budget.get("lifetime") if isinstance(ad_set_budget, dict) else None,
                     "execution_id": self.execution_id
-                }
-                
-                saved_ad_set = await self.db_client.insert("ad_sets", ad_set_entry)
-                
-                # Add to campaign structure
-                campaign_with_ad_sets["ad_sets"].append({
-                    "id": saved_ad_set["id"],
-                    "name": saved_ad_set["name"],
-                    "creative_brief": saved_ad_set.get("creative_brief", {}),
-                    "materials": saved_ad_set.get("materials", {}),
-                    "target_audience": saved_ad_set.get("target_audience", {}),
-                    "post_frequency": saved_ad_set.get("post_frequency", 3),
-                    "post_volume": saved_ad_set.get("post_volume", 5)
                 })
-            
-            saved_campaigns.append(campaign_with_ad_sets)
         
-        logger.info(f"✅ CAMPAIGN PLAN SAVED: {len(saved_campaigns)} campaigns")
-        return saved_campaigns
+        # Campaigns first: ad sets reference them by foreign key
+        saved_campaigns = await self.db_client.insert_many("campaigns", campaign_entries)
+        saved_ad_sets = await self.db_client.insert_many("ad_sets", ad_set_entries) if ad_set_entries else []
+        
+        # Build the campaign structure for Content Creator
+        campaigns_by_id = {}
+        for saved_campaign in saved_campaigns:
+            campaigns_by_id[saved_campaign["id"]] = {
+                "id": saved_campaign["id"],
+                "name": saved_campaign["name"],
+                "objective": saved_campaign["objective"],
+                "ad_sets": []
+            }
+        
+        for saved_ad_set in saved_ad_sets:
+            campaigns_by_id[saved_ad_set["campaign_id"]]["ad_sets"].append({
+                "id": saved_ad_set["id"],
+                "name": saved_ad_set["name"],
+                "creative_brief": saved_ad_set.get("creative_brief", {}),
+                "materials": saved_ad_set.get("materials", {}),
+                "target_audience": saved_ad_set.get("target_audience", {}),
+                "post_frequency": saved_ad_set.get("post_frequency", 3),
+                "post_volume": saved_ad_set.get("post_volume", 5)
+            })
+        
+        result = list(campaigns_by_id.values())
+        logger.info(f"✅ CAMPAIGN PLAN SAVED: {len(result)} campaigns")
+        return result
     
     def _ensure_valid_uuid(self, id_value: str) -> str:
         """Ensure valid UUID format"""
@@ -6,7 +6,7 @@ Handles fetching and organizing context data from research and initiatives.
 """
 
 from typing import Dict, Any, List
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 import logging
 import json
 
@@ -18,7 +18,7 @@ class PlannerContextManager:
     
     def __init__(self, initiative_id: str):
         self.initiative_id = initiative_id
-        self.db_client = DatabaseClient(initiative_id=initiative_id)
+        self.db_client = get_pooled_client(initiative_id)
     
     async def gather_context(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
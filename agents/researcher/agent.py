@@ -7,7 +7,7 @@ from agents.base.agent import BaseAgent, AgentConfig
 from agents.researcher.prompt_builder import ResearcherPromptBuilder
 from agents.researcher.tools.perplexity_search import PerplexitySearch
 from agents.researcher.models import ResearchOutput, ResearchType
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 from agents.guardrails.initiative_loader import InitiativeLoader
 from agents.guardrails.validators import ResearcherValidator
 from backend.config.settings import settings
@@ -22,7 +22,7 @@ class ResearchAgent(BaseAgent):
     
     def __init__(self, config: AgentConfig):
         self.perplexity = PerplexitySearch()
-        self.db_client = DatabaseClient(initiative_id=config.initiative_id)
+        self.db_client = get_pooled_client(config.initiative_id)
         self.prompt_builder = ResearcherPromptBuilder(config.initiative_id)
         self.validator = ResearcherValidator()
         self.initiative_loader = InitiativeLoader(config.initiative_id)
@@ -80,6 +80,7 @@ class Settings(BaseSettings):
     WAVESPEED_API_BASE: str = "https://api.wavespeed.ai/api/v3"
     WAVESPEED_POLLING_INTERVAL: float = 2.0  # seconds between polls
     WAVESPEED_MAX_POLL_ATTEMPTS: int = 120  # max attempts before timeout
+    WAVESPEED_MAX_CONCURRENT_TASKS: int = 4  # image generations in flight at once
     
     # Budget Configuration
     DEFAULT_DAILY_BUDGET: float = 100.0
@@ -91,6 +92,11 @@ class Settings(BaseSettings):
     CONTENT_CREATOR_SCHEDULE: str = "0 */4 * * *"
     RESEARCHER_SCHEDULE: str = "0 0 * * *"
     METRICS_COLLECTOR_SCHEDULE: str = "0 * * * *"
+    ORCHESTRATOR_CONCURRENCY: int = 8  # Max initiatives processed at once per job
+    # Optional tighter per-model-provider caps, as JSON (e.g. {"grok": 4}); a provider
+    # without an entry is capped only by ORCHESTRATOR_CONCURRENCY
+    PROVIDER_CONCURRENCY: Dict[str, int] = {}
+    SCHEDULER_DB_URL: Optional[str] = None  # Persistent job store; falls back to SUPABASE_DB_URL
     
     # Content Generation
     MAX_HASHTAGS: int = 30
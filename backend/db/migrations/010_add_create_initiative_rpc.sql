@@ -0,0 +1,62 @@
+-- backend/db/migrations/010_add_create_initiative_rpc.sql
+-- Migration: Create an initiative and its encrypted tokens in one transaction
+-- Revision ID: 010
+-- Revises: 009
+
+-- ============================================================================
+-- UPGRADE: Add create_initiative_with_tokens RPC
+-- ============================================================================
+
+-- Inserts the initiative row and its initiative_tokens row atomically, so the
+-- setup script needs a single round-trip and no manual rollback on failure.
+CREATE OR REPLACE FUNCTION create_initiative_with_tokens(
+    p_initiative JSONB,
+    p_tokens JSONB
+) RETURNS UUID AS $$
+DECLARE
+    v_initiative_id UUID;
+BEGIN
+    INSERT INTO initiatives (
+        id, name, description, category, optimization_metric,
+        daily_budget, total_budget, model_provider, is_active,
+        facebook_page_id, facebook_page_name,
+        instagram_business_id, instagram_username
+    )
+    SELECT
+        COALESCE(i.id, uuid_generate_v4()), i.name, i.description, i.category, i.optimization_metric,
+        i.daily_budget, i.total_budget, COALESCE(i.model_provider, 'openai'), COALESCE(i.is_active, true),
+        i.facebook_page_id, i.facebook_page_name,
+        i.instagram_business_id, i.instagram_username
+    FROM jsonb_populate_record(NULL::initiatives, p_initiative) AS i
+    RETURNING id INTO v_initiative_id;
+
+    INSERT INTO initiative_tokens (
+        initiative_id,
+        fb_page_access_token_encrypted, fb_system_user_token_encrypted,
+        insta_access_token_encrypted, insta_app_id_encrypted, insta_app_secret_encrypted,
+        fb_page_id, fb_page_name, insta_business_id, insta_username,
+        created_by
+    )
+    SELECT
+        v_initiative_id,
+        t.fb_page_access_token_encrypted, t.fb_system_user_token_encrypted,
+        t.insta_access_token_encrypted, t.insta_app_id_encrypted, t.insta_app_secret_encrypted,
+        t.fb_page_id, t.fb_page_name, t.insta_business_id, t.insta_username,
+        t.created_by
+    FROM jsonb_populate_record(NULL::initiative_tokens, p_tokens) AS t;
+
+    RETURN v_initiative_id;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION create_initiative_with_tokens(JSONB, JSONB) IS
+    'Creates an initiative and its encrypted tokens in a single transaction. Returns the initiative id.';
+
+-- ============================================================================
+-- DOWNGRADE: Remove create_initiative_with_tokens RPC
+-- ============================================================================
+-- To rollback this migration, run the following:
+
+/*
+DROP FUNCTION IF EXISTS create_initiative_with_tokens(JSONB, JSONB);
+*/
@@ -0,0 +1,35 @@
+-- backend/db/migrations/011_add_initiative_run_schedule.sql
+-- Migration: Track when each initiative is next due for orchestration
+-- Revision ID: 011
+-- Revises: 010
+
+-- ============================================================================
+-- UPGRADE: Add per-initiative run schedule
+-- ============================================================================
+
+-- The scheduler only orchestrates initiatives whose next_run_due_at has
+-- passed, then pushes it forward by run_interval_minutes. Existing and new
+-- initiatives default to due immediately.
+ALTER TABLE initiatives
+ADD COLUMN IF NOT EXISTS next_run_due_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+ADD COLUMN IF NOT EXISTS run_interval_minutes INTEGER NOT NULL DEFAULT 360;
+
+-- Supports the scheduler's "active and due" lookup
+CREATE INDEX IF NOT EXISTS idx_initiatives_active_next_run
+    ON initiatives(next_run_due_at)
+    WHERE is_active = TRUE;
+
+COMMENT ON COLUMN initiatives.next_run_due_at IS 'Earliest time the scheduler will orchestrate this initiative again';
+COMMENT ON COLUMN initiatives.run_interval_minutes IS 'Minimum minutes between scheduled orchestrator runs';
+
+-- ============================================================================
+-- DOWNGRADE: Remove per-initiative run schedule
+-- ============================================================================
+-- To rollback this migration, run the following:
+
+/*
+DROP INDEX IF EXISTS idx_initiatives_active_next_run;
+ALTER TABLE initiatives
+DROP COLUMN IF EXISTS run_interval_minutes,
+DROP COLUMN IF EXISTS next_run_due_at;
+*/
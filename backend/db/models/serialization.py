@@ -12,6 +12,11 @@ from uuid import UUID
 from enum import Enum
 import json
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for complex types"""
@@ -32,6 +37,19 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def dumps_for_log(data: Any) -> str:
+    """
+    Serialize a (possibly large, nested) structure to compact JSON for log
+    output. Uses orjson when installed, which is much faster than repr()
+    or json.dumps for big dicts. Callers should still guard with
+    logger.isEnabledFor() so nothing is serialized when the level is off.
+    """
+    default = CustomJSONEncoder().default
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=default)
+
+
 def serialize_value(value: Any) -> Any:
     """
     Recursively serialize a value to be JSON-compatible.
@@ -2,14 +2,53 @@
 
 from supabase import create_client, Client
 from typing import Optional, Dict, Any, List
+import asyncio
 import os
+from collections import OrderedDict
+import httpx
 from dotenv import load_dotenv
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential
+)
 
 # Import serialization utilities
 from backend.db.models.serialization import prepare_for_db, serialize_dict
 
 load_dotenv()
 
+# Comparison suffixes accepted in filter keys ("column__op")
+FILTER_OPERATORS = {"eq", "neq", "gt", "gte", "lt", "lte"}
+
+# Transient failures worth resending. Reads and idempotent writes (update,
+# upsert, delete) are safe to resend after any transport error; inserts
+# only when the request never reached the server.
+READ_RETRY_ERRORS = (httpx.TransportError, TimeoutError, ConnectionError)
+WRITE_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+RETRY_ATTEMPTS = 4
+RETRY_WAIT = wait_random_exponential(multiplier=0.5, max=8)
+
+
+async def _execute(query, retry_on=READ_RETRY_ERRORS):
+    """
+    Execute a PostgREST query, retrying transient failures with jittered
+    exponential backoff before the caller wraps any error.
+
+    The Supabase client is synchronous, so each attempt runs in a worker
+    thread to keep the event loop free for concurrent workflows.
+    """
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=RETRY_WAIT,
+        retry=retry_if_exception_type(retry_on),
+        reraise=True
+    ):
+        with attempt:
+            return await asyncio.to_thread(query.execute)
+
+
 class DatabaseClient:
     """Supabase client with initiative-based RLS support and automatic serialization"""
 
@@ -68,7 +107,10 @@ class DatabaseClient:
             serialized_data = self._ensure_initiative_id(serialized_data)
 
         try:
-            result = self.client.table(table_name).insert(serialized_data).execute()
+            result = await _execute(
+                self.client.table(table_name).insert(serialized_data),
+                retry_on=WRITE_RETRY_ERRORS
+            )
             if result.data and len(result.data) > 0:
                 return result.data[0]
             else:
@@ -80,8 +122,13 @@ class DatabaseClient:
             print(f"Serialized data: {json.dumps(serialized_data, default=str)[:500]}...")
             raise Exception(f"Database insert failed for table '{table_name}': {str(e)}")
 
-    async def insert_many(self, table_name: str, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Insert multiple records with serialization"""
+    async def insert_many(
+        self,
+        table_name: str,
+        data_list: List[Dict[str, Any]],
+        chunk_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Insert multiple records with serialization, one request per chunk of rows"""
         # Serialize each record
         serialized_list = []
         for data in data_list:
@@ -93,20 +140,43 @@ class DatabaseClient:
             
             serialized_list.append(serialized_data)
 
+        inserted = []
         try:
-            result = self.client.table(table_name).insert(serialized_list).execute()
-            return result.data if result.data else []
+            for start in range(0, len(serialized_list), chunk_size):
+                chunk = serialized_list[start:start + chunk_size]
+                result = await _execute(
+                    self.client.table(table_name).insert(chunk),
+                    retry_on=WRITE_RETRY_ERRORS
+                )
+                inserted.extend(result.data or [])
+            return inserted
         except Exception as e:
             raise Exception(f"Database bulk insert failed for table '{table_name}': {str(e)}")
 
-    async def select(
-        self, 
-        table_name: str, 
-        filters: Optional[Dict[str, Any]] = None,
-        columns: str = "*",
-        limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """Select data with automatic initiative filtering"""
+    def _apply_filters(self, query, filters: Dict[str, Any]):
+        """
+        Apply filters to a query. Keys are column names for equality, or
+        "column__op" for a comparison, e.g. {"next_run_due_at__lte": now}.
+        """
+        for key, value in filters.items():
+            column, _, op = key.partition("__")
+            op = op or "eq"
+            if op not in FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator '{op}' in '{key}'")
+            
+            # Serialize complex filter values
+            serialized_value = self._prepare_data(value)
+            query = getattr(query, op)(column, serialized_value)
+        
+        return query
+
+    def _build_select_query(
+        self,
+        table_name: str,
+        filters: Optional[Dict[str, Any]],
+        columns: str
+    ):
+        """Build a select query with initiative filtering and additional filters"""
         query = self.client.table(table_name).select(columns)
         
         # Special handling for initiatives table vs other tables
@@ -120,17 +190,48 @@ class DatabaseClient:
         
         # Apply additional filters (serialize filter values if needed)
         if filters:
-            for key, value in filters.items():
-                # Serialize complex filter values
-                serialized_value = self._prepare_data(value)
-                query = query.eq(key, serialized_value)
+            query = self._apply_filters(query, filters)
+        
+        return query
+
+    async def select(
+        self, 
+        table_name: str, 
+        filters: Optional[Dict[str, Any]] = None,
+        columns: str = "*",
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Select data with automatic initiative filtering.
+        
+        Pass a column list (e.g. "id, name") to avoid fetching and decoding
+        wide columns that are not needed. With page_size set, rows are fetched
+        in ranges of that size, ordered by id so pages never overlap or skip
+        rows, until a short page is returned.
+        """
+        if page_size:
+            rows = []
+            offset = 0
+            while True:
+                query = self._build_select_query(table_name, filters, columns)
+                query = query.order("id").range(offset, offset + page_size - 1)
+                result = await _execute(query)
+                page = result.data or []
+                rows.extend(page)
+                if len(page) < page_size or (limit and len(rows) >= limit):
+                    break
+                offset += page_size
+            return rows[:limit] if limit else rows
+        
+        query = self._build_select_query(table_name, filters, columns)
 
         # Apply limit
         if limit:
             query = query.limit(limit)
 
         # Execute query
-        result = query.execute()
+        result = await _execute(query)
         return result.data if result.data else []
 
     async def update(
@@ -154,13 +255,11 @@ class DatabaseClient:
                 query = query.eq("initiative_id", self.initiative_id)
         
         # Apply additional filters (serialize filter values if needed)
-        for key, value in filters.items():
-            serialized_value = self._prepare_data(value)
-            query = query.eq(key, serialized_value)
+        query = self._apply_filters(query, filters)
 
         # Execute update
         try:
-            result = query.execute()
+            result = await _execute(query)
             if result.data and len(result.data) > 0:
                 return result.data[0]
             return None
@@ -188,7 +287,7 @@ class DatabaseClient:
                 on_conflict=on_conflict or 'id'
             )
             
-            result = query.execute()
+            result = await _execute(query)
             if result.data and len(result.data) > 0:
                 return result.data[0]
             return None
@@ -212,12 +311,10 @@ class DatabaseClient:
                 query = query.eq("initiative_id", self.initiative_id)
         
         # Apply additional filters (serialize filter values if needed)
-        for key, value in filters.items():
-            serialized_value = self._prepare_data(value)
-            query = query.eq(key, serialized_value)
+        query = self._apply_filters(query, filters)
 
         # Execute delete
-        result = query.execute()
+        result = await _execute(query)
         return len(result.data) > 0 if result.data else False
 
     async def get_by_id(self, table_name: str, id: str) -> Optional[Dict[str, Any]]:
@@ -235,4 +332,34 @@ class DatabaseClient:
 # Factory function for backward compatibility
 def get_database_client(initiative_id: Optional[str] = None) -> DatabaseClient:
     """Create a database client instance"""
-    return DatabaseClient(initiative_id=initiative_id)
\ No newline at end of file
+    return DatabaseClient(initiative_id=initiative_id)
+
+
+# Process-wide clients, one per initiative (None = unscoped service client),
+# least recently used first
+_pooled_clients: "OrderedDict[Optional[str], DatabaseClient]" = OrderedDict()
+MAX_POOLED_CLIENTS = 64
+
+def get_pooled_client(initiative_id: Optional[str] = None) -> DatabaseClient:
+    """
+    Get a long-lived database client for the initiative.
+
+    Clients are created once per initiative and reused, so repeated calls
+    keep the underlying HTTP connections alive instead of paying connection
+    and TLS setup for every agent, job or insert. Each initiative gets its
+    own client because the RLS context header is set on the client session;
+    that is the only per-initiative state, so concurrent workflows for the
+    same initiative can share one. At most MAX_POOLED_CLIENTS are kept so a
+    long-running scheduler doesn't grow the pool without bound.
+    """
+    client = _pooled_clients.get(initiative_id)
+    if client is None:
+        client = DatabaseClient(initiative_id=initiative_id)
+        _pooled_clients[initiative_id] = client
+        # Evicted clients are not closed: a running workflow may still hold
+        # one, and its connections are released once it is garbage collected
+        while len(_pooled_clients) > MAX_POOLED_CLIENTS:
+            _pooled_clients.popitem(last=False)
+    else:
+        _pooled_clients.move_to_end(initiative_id)
+    return client
@@ -10,7 +10,7 @@ from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
 
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 from backend.db.models.execution_log import ExecutionLogs
 from backend.db.models.campaign import Campaigns
 from backend.db.models.ad_set import AdSets
@@ -31,7 +31,7 @@ class ExecutionDataService:
         Args:
             initiative_id: Optional initiative ID for RLS
         """
-        self.db = DatabaseClient(initiative_id=initiative_id)
+        self.db = get_pooled_client(initiative_id)
     
     async def get_execution_summary(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -115,7 +115,7 @@ class ExecutionDataService:
             
             # Set initiative context if we have it
             if summary.get('initiative_id') and not self.db.initiative_id:
-                self.db = DatabaseClient(initiative_id=summary['initiative_id'])
+                self.db = get_pooled_client(summary['initiative_id'])
             
             # Fetch all related data in parallel (simulated with sequential calls)
             campaigns = await self._fetch_campaigns(execution_id)
@@ -18,7 +18,7 @@ import base64
 from pathlib import Path
 
 from backend.config.settings import settings
-from backend.db.supabase_client import DatabaseClient
+from backend.db.supabase_client import get_pooled_client
 from supabase import create_client, Client as SupabaseClient
 
 logger = logging.getLogger(__name__)
@@ -234,7 +234,7 @@ class MediaGenerationService:
         """Store media file metadata in database"""
         try:
             logger.debug(f"Storing media metadata for {file_type}")
-            db = DatabaseClient(initiative_id=str(initiative_id))
+            db = get_pooled_client(str(initiative_id))
             
             # Extract execution_id from metadata if available
             execution_id = metadata.get('execution_id')
@@ -267,18 +267,19 @@ class ImageGenerationService(MediaGenerationService):
         num_per_prompt: int = 1,
         size: str = "1024*1024"
     ) -> List[str]:
-        """Generate images using Wavespeed and upload to Supabase"""
-        urls = []
-        
+        """
+        Generate images using Wavespeed and upload to Supabase.
+        Images are generated concurrently (bounded by
+        WAVESPEED_MAX_CONCURRENT_TASKS); URLs come back in prompt order.
+        """
         logger.info(f"Starting image generation for {len(prompts)} prompts")
+        semaphore = asyncio.Semaphore(settings.WAVESPEED_MAX_CONCURRENT_TASKS)
         
         async with aiohttp.ClientSession() as session:
-            for i, prompt in enumerate(prompts, 1):
-                logger.info(f"Processing prompt {i}/{len(prompts)}: {prompt[:50]}...")
-                
-                for j in range(num_per_prompt):
+            async def generate_one(i: int, prompt: str, j: int) -> Optional[str]:
+                async with semaphore:
                     try:
-                        logger.debug(f"Generating image {j+1}/{num_per_prompt} for prompt {i}")
+                        logger.debug(f"Generating image {j+1}/{num_per_prompt} for prompt {i}/{len(prompts)}: {prompt[:50]}...")
                         
                         # Submit generation task
                         payload = {
@@ -300,6 +301,7 @@ class ImageGenerationService(MediaGenerationService):
                         # Poll for completion
                         output_url = await self._poll_for_result(session, request_id)
                         
+                        public_url = None
                         if output_url:
                             # Download the generated image
                             image_bytes = await self._download_media(session, output_url)
@@ -322,16 +324,23 @@ class ImageGenerationService(MediaGenerationService):
                                     "execution_step": getattr(self, 'execution_step', None)
                                 }
                             )
-                            urls.append(public_url)
                         
-                        # Rate limiting
+                        # Rate limiting (per concurrent slot)
                         await asyncio.sleep(1)
+                        return public_url
                         
                     except Exception as e:
                         logger.error(f"Failed to generate image for prompt '{prompt}': {e}")
-                        # Continue with next prompt instead of failing completely
-                        continue
+                        # Skip this image instead of failing completely
+                        return None
+            
+            results = await asyncio.gather(*(
+                generate_one(i, prompt, j)
+                for i, prompt in enumerate(prompts, 1)
+                for j in range(num_per_prompt)
+            ))
         
+        urls = [url for url in results if url]
         logger.info(f"✅ Image generation complete. Generated {len(urls)} images")
         return urls
 
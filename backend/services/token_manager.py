@@ -9,7 +9,7 @@ import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
-from backend.utils.encryption import TokenEncryption
+from backend.utils.encryption import get_encryption
 from backend.db.supabase_client import DatabaseClient
 from supabase import create_client
 
@@ -27,7 +27,7 @@ class TokenManager:
             initiative_id: Initiative identifier
         """
         self.initiative_id = initiative_id
-        self.encryption = TokenEncryption()
+        self.encryption = get_encryption()
         self._tokens_cache = None
         self._cache_timestamp = None
         self.cache_duration = 3600  # Cache for 1 hour
@@ -5,7 +5,7 @@ import base64
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Optional
+from typing import List, Optional
 
 class TokenEncryption:
     """Utility class for encrypting/decrypting sensitive tokens"""
@@ -56,6 +56,23 @@ class TokenEncryption:
         encrypted = self.cipher.encrypt(plaintext.encode())
         return base64.urlsafe_b64encode(encrypted).decode()
     
+    def encrypt_many(self, plaintexts: List[str]) -> List[str]:
+        """
+        Encrypt several strings with the same cipher instance
+        
+        Args:
+            plaintexts: The strings to encrypt
+            
+        Returns:
+            Base64-encoded encrypted strings, in the same order
+        """
+        cipher = self.cipher
+        return [
+            base64.urlsafe_b64encode(cipher.encrypt(plaintext.encode())).decode()
+            if plaintext else ""
+            for plaintext in plaintexts
+        ]
+    
     def decrypt(self, ciphertext: str) -> str:
         """
         Decrypt an encrypted string
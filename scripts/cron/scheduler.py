@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# scripts/cron/scheduler.py
+
+"""
+Scheduler that runs the agent workflows for every active initiative
+on the cron schedules configured in settings.
+
+Usage:
+    python scripts/cron/scheduler.py
+"""
+
+import asyncio
+import signal
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Setup logging first
+from backend.config.logging_config import LoggingConfig
+LoggingConfig.setup_logging(log_level='INFO')
+logger = logging.getLogger(__name__)
+
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from agents.base.agent import AgentConfig, AgentOutput
+from agents.orchestrator.agent import OrchestratorAgent, WorkflowType
+from backend.db.supabase_client import get_pooled_client
+from backend.config.settings import settings
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+
+class InitiativeRow(NamedTuple):
+    """The initiative columns the scheduler needs, parsed once per select"""
+    id: str
+    name: str
+    model_provider: str
+    run_interval_minutes: int
+    next_run_due_at: Optional[datetime]
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "InitiativeRow":
+        next_run_due_at = record.get("next_run_due_at")
+        return cls(
+            id=record["id"],
+            name=record["name"],
+            model_provider=record.get("model_provider") or "openai",
+            run_interval_minutes=record.get("run_interval_minutes") or 360,
+            next_run_due_at=datetime.fromisoformat(next_run_due_at) if next_run_due_at else None
+        )
+
+    def next_due_after(self, tick_start: datetime) -> datetime:
+        """
+        Next due time after a successful run in the tick started at
+        tick_start. Anchored on the previous due time, so run time and
+        trigger jitter don't push the initiative past the next tick.
+        """
+        interval = timedelta(minutes=self.run_interval_minutes)
+        if self.next_run_due_at is None:
+            return tick_start + interval
+        return max(self.next_run_due_at + interval, tick_start)
+
+
+# Orchestrators reused across scheduler ticks, keyed by
+# (initiative_id, workflow, model_provider)
+_AGENT_CACHE: Dict[Tuple[str, str, str], OrchestratorAgent] = {}
+
+
+def get_orchestrator(initiative: InitiativeRow, workflow: WorkflowType) -> OrchestratorAgent:
+    """Get a cached orchestrator for the initiative, building it on first use"""
+    key = (initiative.id, workflow, initiative.model_provider)
+
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        # Drop orchestrators built for a previous model provider
+        for stale_key in [k for k in _AGENT_CACHE if k[:2] == key[:2]]:
+            del _AGENT_CACHE[stale_key]
+
+        config = AgentConfig(
+            name="Scheduled Orchestrator",
+            description=f"Scheduled {workflow} run",
+            initiative_id=initiative.id,
+            model_provider=initiative.model_provider
+        )
+        agent = OrchestratorAgent(config, workflow=workflow)
+        _AGENT_CACHE[key] = agent
+
+    return agent
+
+
+async def process_initiative_orchestration(
+    initiative: InitiativeRow,
+    workflow: WorkflowType = "planning-only"
+) -> AgentOutput:
+    """Run a single workflow for one initiative"""
+    logger.info(f"Running '{workflow}' for initiative {initiative.name} ({initiative.id})")
+
+    agent = get_orchestrator(initiative, workflow)
+    # Fresh execution ids and context for every run of a cached orchestrator
+    agent.reset_state()
+    result = await agent.execute({"trigger": "scheduler"})
+
+    if result.success:
+        logger.info(f"✅ '{workflow}' completed for initiative {initiative.id}")
+    else:
+        logger.error(f"❌ '{workflow}' failed for initiative {initiative.id}: {result.errors}")
+
+    return result
+
+
+async def run_workflow_for_active_initiatives(workflow: WorkflowType, due_only: bool = False):
+    """
+    Run a workflow for every active initiative.
+
+    Initiatives are grouped by model provider and processed
+    concurrently: at most settings.ORCHESTRATOR_CONCURRENCY at once in
+    total, and each group within its settings.PROVIDER_CONCURRENCY cap
+    when one is set, so one slow provider or failing initiative does not
+    hold up or abort the others. The caps are real concurrency because
+    database calls run in worker threads and LLM calls are awaited.
+
+    With due_only, initiatives whose next_run_due_at is still in the
+    future are skipped in the query, and each successful run moves
+    next_run_due_at forward by the initiative's run_interval_minutes.
+    Failed runs leave it alone so they are retried on the next tick.
+    """
+    db = get_pooled_client()
+    tick_start = datetime.now(timezone.utc)
+    filters: Dict[str, Any] = {"is_active": True}
+    if due_only:
+        filters["next_run_due_at__lte"] = tick_start.isoformat()
+
+    records = await db.select(
+        "initiatives",
+        filters=filters,
+        columns=", ".join(InitiativeRow._fields),
+        page_size=1000
+    )
+    initiatives = [InitiativeRow.from_record(record) for record in records]
+
+    if not initiatives:
+        logger.info(f"No {'due' if due_only else 'active'} initiatives for '{workflow}'")
+        return
+
+    groups: Dict[str, List[InitiativeRow]] = defaultdict(list)
+    for initiative in initiatives:
+        groups[initiative.model_provider].append(initiative)
+
+    overall = asyncio.Semaphore(settings.ORCHESTRATOR_CONCURRENCY)
+    semaphores = {
+        provider: asyncio.Semaphore(
+            settings.PROVIDER_CONCURRENCY.get(provider, settings.ORCHESTRATOR_CONCURRENCY)
+        )
+        for provider in groups
+    }
+
+    async def _run(provider: str, initiative: InitiativeRow) -> AgentOutput:
+        # Take the provider slot first so a busy provider doesn't hold
+        # global slots that other providers could use
+        async with semaphores[provider], overall:
+            result = await process_initiative_orchestration(initiative, workflow)
+
+        if due_only and result.success:
+            next_run = initiative.next_due_after(tick_start)
+            await db.update(
+                "initiatives",
+                data={"next_run_due_at": next_run.isoformat()},
+                filters={"id": initiative.id}
+            )
+
+        return result
+
+    ordered = [(provider, initiative) for provider, group in groups.items() for initiative in group]
+    results = await asyncio.gather(
+        *(_run(provider, initiative) for provider, initiative in ordered),
+        return_exceptions=True
+    )
+
+    for (_, initiative), result in zip(ordered, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"❌ '{workflow}' raised for initiative {initiative.id}",
+                exc_info=result
+            )
+
+
+async def run_orchestrator_job():
+    """Plan campaigns and allocate budget for all active initiatives"""
+    await run_workflow_for_active_initiatives("planning-only", due_only=True)
+
+
+async def run_content_creator_job():
+    """Generate new content for all active initiatives"""
+    await run_workflow_for_active_initiatives("content-creation-only")
+
+
+async def run_researcher_job():
+    """Gather market research for all active initiatives"""
+    await run_workflow_for_active_initiatives("research-only")
+
+
+async def run_metrics_collector_job():
+    """Collect performance metrics for all active initiatives"""
+    # Metrics are not collected by an agent yet; keep the schedule slot
+    # so the collector can be plugged in without touching the scheduler.
+    logger.info("Metrics collection is not configured - skipping")
+
+
+# (job id, display name, job function, schedule setting, misfire grace seconds)
+JOBS = [
+    ("orchestrator_job", "Orchestrator", run_orchestrator_job, "ORCHESTRATOR_SCHEDULE", 300),
+    ("content_creator_job", "Content Creator", run_content_creator_job, "CONTENT_CREATOR_SCHEDULE", 300),
+    ("researcher_job", "Researcher", run_researcher_job, "RESEARCHER_SCHEDULE", 600),
+    ("metrics_collector_job", "Metrics Collector", run_metrics_collector_job, "METRICS_COLLECTOR_SCHEDULE", 120),
+]
+
+# Crontab strings are parsed once at import, not on every scheduler (re)start
+_TRIGGERS: Dict[str, CronTrigger] = {
+    schedule_setting: CronTrigger.from_crontab(getattr(settings, schedule_setting))
+    for _, _, _, schedule_setting, _ in JOBS
+}
+
+
+def _scheduler_db_url() -> Optional[str]:
+    """Postgres URL for the persistent job store, if one is configured"""
+    url = settings.SCHEDULER_DB_URL or settings.SUPABASE_DB_URL
+    if url and url.startswith("postgres://"):
+        # SQLAlchemy only accepts the postgresql:// scheme
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+def _build_jobstores() -> Dict[str, Any]:
+    """
+    Persist agent jobs in Postgres so next run times survive restarts.
+    The 'memory' store holds jobs that cannot be serialized (bound methods).
+    """
+    jobstores: Dict[str, Any] = {"memory": MemoryJobStore()}
+
+    url = _scheduler_db_url()
+    if url:
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        jobstores["default"] = SQLAlchemyJobStore(url=url, tablename="scheduler_jobs")
+    else:
+        logger.warning("⚠️ No SCHEDULER_DB_URL or SUPABASE_DB_URL set - job state will not persist")
+        jobstores["default"] = MemoryJobStore()
+
+    return jobstores
+
+
+class CampaignScheduler:
+    """Registers agent jobs on an asyncio cron scheduler"""
+
+    def __init__(self):
+        # coalesce + max_instances=1: runs missed during downtime collapse
+        # into a single run instead of replaying back-to-back
+        self.scheduler = AsyncIOScheduler(
+            jobstores=_build_jobstores(),
+            job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 300}
+        )
+
+    def initialize_jobs(self):
+        """Register all scheduled jobs"""
+        for job_id, name, func, schedule_setting, grace in JOBS:
+            trigger = _TRIGGERS[schedule_setting]
+
+            # Keep a persisted job (and its next run time) unless its schedule changed
+            existing = self.scheduler.get_job(job_id)
+            if existing is not None and str(existing.trigger) == str(trigger):
+                continue
+
+            self.scheduler.add_job(
+                func,
+                trigger,
+                id=job_id,
+                name=name,
+                misfire_grace_time=grace,
+                replace_existing=True
+            )
+
+        self.scheduler.add_job(
+            self.log_heartbeat,
+            IntervalTrigger(minutes=5),
+            id="heartbeat",
+            name="Heartbeat",
+            jobstore="memory",
+            replace_existing=True
+        )
+
+        logger.info(f"Initialized {len(self.scheduler.get_jobs())} scheduled jobs")
+
+    def log_heartbeat(self):
+        """Log that the scheduler is alive"""
+        logger.info(f"Scheduler running with {len(self.scheduler.get_jobs())} jobs")
+
+    def start(self):
+        """Initialize jobs and start the scheduler"""
+        # Start paused so persisted jobs are loaded before reconciling them
+        self.scheduler.start(paused=True)
+        self.initialize_jobs()
+        self.scheduler.resume()
+        logger.info("Scheduler started")
+
+    def shutdown(self):
+        """Stop the scheduler"""
+        self.scheduler.shutdown()
+        logger.info("Scheduler stopped")
+
+
+async def main():
+    """Main entry point"""
+    loop = asyncio.get_running_loop()
+    # Database calls run in worker threads; give every job enough of them
+    # that the default pool (min(32, cpus + 4)) doesn't cap concurrency
+    # below ORCHESTRATOR_CONCURRENCY when jobs overlap
+    loop.set_default_executor(ThreadPoolExecutor(
+        max_workers=settings.ORCHESTRATOR_CONCURRENCY * len(JOBS),
+        thread_name_prefix="scheduler-io"
+    ))
+
+    scheduler = CampaignScheduler()
+    scheduler.start()
+
+    # Sleep until SIGINT/SIGTERM instead of polling
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await stop.wait()
+    finally:
+        scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    # Faster event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+# scripts/setup/_env.py
+
+"""
+Environment access shared by the setup scripts.
+Loads .env once per process and caches variable lookups.
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env() -> bool:
+    """Load .env into the environment; later calls are no-ops"""
+    return load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def env(name: str) -> Optional[str]:
+    """Get an environment variable, loading .env first if needed"""
+    load_env()
+    return os.environ.get(name)
+
+
+def log_env_summary(logger: logging.Logger):
+    """Log which Supabase settings are loaded, with keys truncated"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    logger.info("Loaded environment variables:")
+    logger.info("SUPABASE_URL=%s", env("SUPABASE_URL"))
+    logger.info("SUPABASE_DB_URL set=%s", bool(env("SUPABASE_DB_URL")))
+    for name in ("SUPABASE_KEY", "SUPABASE_SERVICE_KEY"):
+        value = env(name)
+        if value:
+            logger.info("%s=%s... (truncated)", name, value[:6])  # avoid leaking full key
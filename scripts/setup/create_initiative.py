@@ -8,15 +8,22 @@ and stores everything in Supabase.
 
 Usage:
     python scripts/setup/create_initiative.py
+    python scripts/setup/create_initiative.py --from-json initiatives.json
+
+The --from-json file holds a list of initiatives, each shaped like
+{"basic": {...}, "facebook": {...}, "instagram": {...}} with the same
+keys the interactive prompts collect. They are created without prompts.
 """
 
+import argparse
 import asyncio
+import json
 import os
 import sys
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from getpass import getpass
 import logging
 
@@ -28,20 +35,58 @@ from backend.config.logging_config import LoggingConfig
 LoggingConfig.setup_logging(log_level='INFO')
 logger = logging.getLogger(__name__)
 
-from backend.utils.encryption import TokenEncryption
-from backend.db.supabase_client import DatabaseClient
-from supabase import create_client
+from backend.utils.encryption import TokenEncryption, get_encryption
+from backend.db.supabase_client import get_pooled_client
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# initiatives column -> (path into the collected {"basic", "facebook", "instagram"}
+# info, value stored when the key is missing)
+INITIATIVE_SCHEMA = [
+    ("name", ("basic", "name"), None),
+    ("description", ("basic", "description"), ""),
+    ("category", ("basic", "category"), None),
+    ("optimization_metric", ("basic", "optimization_metric"), None),
+    ("daily_budget", ("basic", "daily_budget"), None),
+    ("total_budget", ("basic", "total_budget"), None),
+    # Non-sensitive metadata
+    ("facebook_page_id", ("facebook", "page_id"), None),
+    ("facebook_page_name", ("facebook", "page_name"), None),
+    ("instagram_business_id", ("instagram", "business_id"), None),
+    ("instagram_username", ("instagram", "username"), None),
+]
+
+# initiative_tokens metadata column -> (path into the same info, default)
+TOKEN_METADATA_SCHEMA = [
+    ("fb_page_id", ("facebook", "page_id"), None),
+    ("fb_page_name", ("facebook", "page_name"), None),
+    ("insta_business_id", ("instagram", "business_id"), None),
+    ("insta_username", ("instagram", "username"), None),
+]
+
+_MISSING = object()
+
+
+def _dig(data: Dict[str, Any], path: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    Follow a key path through nested dicts, returning default if any step
+    is missing (like dict.get: a stored None is returned as None)
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            return default
+    return data
+
 
 class InitiativeCreator:
     """Interactive initiative creation with encrypted token storage"""
     
     def __init__(self):
-        self.encryption = TokenEncryption()
         self.initiative_id = str(uuid.uuid4())
         self.tokens = {}
         self.metadata = {}
@@ -207,92 +252,60 @@ class InitiativeCreator:
     
     def encrypt_tokens(self, fb_tokens: Dict, ig_tokens: Dict) -> Dict[str, str]:
         """Encrypt sensitive tokens"""
-        encrypted = {}
-        
-        # Encrypt Facebook tokens
-        if fb_tokens.get('page_access_token'):
-            encrypted['fb_page_access_token_encrypted'] = self.encryption.encrypt(
-                fb_tokens['page_access_token']
-            )
-        
-        if fb_tokens.get('system_user_token'):
-            encrypted['fb_system_user_token_encrypted'] = self.encryption.encrypt(
-                fb_tokens['system_user_token']
-            )
-        
-        # Encrypt Instagram tokens
-        if ig_tokens.get('access_token'):
-            encrypted['insta_access_token_encrypted'] = self.encryption.encrypt(
-                ig_tokens['access_token']
-            )
-        
-        if ig_tokens.get('app_id'):
-            encrypted['insta_app_id_encrypted'] = self.encryption.encrypt(
-                ig_tokens['app_id']
-            )
-        
-        if ig_tokens.get('app_secret'):
-            encrypted['insta_app_secret_encrypted'] = self.encryption.encrypt(
-                ig_tokens['app_secret']
-            )
-        
-        return encrypted
+        # Map encrypted column name -> plaintext token
+        plaintext = {
+            'fb_page_access_token_encrypted': fb_tokens.get('page_access_token'),
+            'fb_system_user_token_encrypted': fb_tokens.get('system_user_token'),
+            'insta_access_token_encrypted': ig_tokens.get('access_token'),
+            'insta_app_id_encrypted': ig_tokens.get('app_id'),
+            'insta_app_secret_encrypted': ig_tokens.get('app_secret'),
+        }
+        
+        # Only store tokens that were provided, encrypted in one batch
+        columns = [column for column, value in plaintext.items() if value]
+        # Shared cipher, created on first use (after run() has ensured a key exists)
+        values = get_encryption().encrypt_many([plaintext[column] for column in columns])
+        return dict(zip(columns, values))
     
     async def save_to_database(self, basic_info: Dict, fb_tokens: Dict, ig_tokens: Dict):
         """Save initiative and encrypted tokens to Supabase"""
         try:
-            # Initialize Supabase client with service key for admin operations
-            client = create_client(
-                os.getenv("SUPABASE_URL"),
-                os.getenv("SUPABASE_SERVICE_KEY")
-            )
+            # Shared service-key client for admin operations
+            client = get_pooled_client().raw_client()
+            
+            sources = {"basic": basic_info, "facebook": fb_tokens, "instagram": ig_tokens}
             
             # Prepare initiative data
             initiative_data = {
                 "id": self.initiative_id,
-                "name": basic_info['name'],
-                "description": basic_info.get('description', ''),
-                "category": basic_info.get('category'),
-                "optimization_metric": basic_info.get('optimization_metric'),
-                "daily_budget": basic_info.get('daily_budget'),
-                "total_budget": basic_info.get('total_budget'),
+                **{column: _dig(sources, path, default) for column, path, default in INITIATIVE_SCHEMA},
                 "model_provider": "openai",
                 "is_active": True,
-                # Store non-sensitive metadata
-                "facebook_page_id": fb_tokens.get('page_id'),
-                "facebook_page_name": fb_tokens.get('page_name'),
-                "instagram_business_id": ig_tokens.get('business_id'),
-                "instagram_username": ig_tokens.get('username'),
             }
             
-            # Save initiative
-            result = client.table("initiatives").insert(initiative_data).execute()
-            
-            if not result.data:
-                raise Exception("Failed to create initiative")
-            
             # Encrypt sensitive tokens
             encrypted_tokens = self.encrypt_tokens(fb_tokens, ig_tokens)
             
             # Prepare token data
             token_data = {
-                "initiative_id": self.initiative_id,
                 **encrypted_tokens,
-                # Non-sensitive metadata
-                "fb_page_id": fb_tokens.get('page_id'),
-                "fb_page_name": fb_tokens.get('page_name'),
-                "insta_business_id": ig_tokens.get('business_id'),
-                "insta_username": ig_tokens.get('username'),
+                **{column: _dig(sources, path, default) for column, path, default in TOKEN_METADATA_SCHEMA},
                 "created_by": "setup_script"
             }
             
-            # Save encrypted tokens
-            token_result = client.table("initiative_tokens").insert(token_data).execute()
+            # Save initiative and encrypted tokens in one transaction
+            # (see migration 010_add_create_initiative_rpc.sql). The client is
+            # synchronous, so run the request in a worker thread to keep the
+            # event loop free for other initiatives in --from-json mode.
+            result = await asyncio.to_thread(
+                client.rpc(
+                    "create_initiative_with_tokens",
+                    {"p_initiative": initiative_data, "p_tokens": token_data}
+                ).execute
+            )
             
-            if not token_result.data:
-                # Rollback initiative creation if token storage fails
-                client.table("initiatives").delete().eq("id", self.initiative_id).execute()
-                raise Exception("Failed to store tokens")
+            if not result.data:
+                raise Exception("Failed to create initiative")
             
             return True
             
@@ -361,8 +374,90 @@ class InitiativeCreator:
             sys.exit(1)
 
 
+# Required keys per section for non-interactive configs
+REQUIRED_CONFIG_KEYS = {
+    "basic": ("name",),
+    "facebook": ("page_id", "page_access_token"),
+    "instagram": ("business_id", "access_token"),
+}
+
+
+def _normalize_budget(value: Any) -> Any:
+    """Accept a plain USD amount as well as {"amount", "currency"}"""
+    if isinstance(value, (int, float)):
+        return {"amount": float(value), "currency": "USD"}
+    return value
+
+
+async def _create_from_config(config: Dict[str, Any], semaphore: asyncio.Semaphore) -> str:
+    """Create one initiative from a config dict and return its id"""
+    missing = [
+        f"{section}.{key}"
+        for section, keys in REQUIRED_CONFIG_KEYS.items()
+        for key in keys
+        if not _dig(config, (section, key))
+    ]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    
+    basic_info = dict(config["basic"])
+    for budget_key in ("daily_budget", "total_budget"):
+        basic_info[budget_key] = _normalize_budget(basic_info.get(budget_key))
+    
+    creator = InitiativeCreator()
+    async with semaphore:
+        await creator.save_to_database(basic_info, config["facebook"], config["instagram"])
+    return creator.initiative_id
+
+
+async def run_bulk(configs: List[Dict[str, Any]], concurrency: int = 8) -> int:
+    """Create initiatives from configs concurrently; returns the failure count"""
+    if not os.getenv("ENCRYPTION_KEY"):
+        logger.error("❌ ENCRYPTION_KEY must be set for non-interactive setup")
+        return len(configs)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(
+        *(_create_from_config(config, semaphore) for config in configs),
+        return_exceptions=True
+    )
+    
+    failures = 0
+    for config, result in zip(configs, results):
+        name = _dig(config, ("basic", "name")) or "<unnamed>"
+        if isinstance(result, BaseException):
+            failures += 1
+            logger.error(f"❌ Failed to create initiative '{name}': {result}")
+        else:
+            logger.info(f"✅ Created initiative '{name}': {result}")
+    
+    logger.info(f"Created {len(configs) - failures}/{len(configs)} initiatives")
+    return failures
+
+
 async def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Create initiatives with encrypted tokens")
+    parser.add_argument(
+        "--from-json",
+        type=Path,
+        help="JSON file with a list of initiative configs (skips all prompts)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Initiatives created at once in --from-json mode (default: 8)"
+    )
+    args = parser.parse_args()
+    
+    if args.from_json:
+        configs = json.loads(args.from_json.read_text())
+        if isinstance(configs, dict):
+            configs = [configs]
+        failures = await run_bulk(configs, args.concurrency)
+        sys.exit(1 if failures else 0)
+    
     creator = InitiativeCreator()
     await creator.run()
 
@@ -5,47 +5,40 @@ from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-print(f"Path: {str(Path(__file__).parent.parent.parent)}")
 
-import os
-import asyncio
-from supabase import create_client
-from backend.config.settings import settings
-from dotenv import load_dotenv
+from backend.db.supabase_client import get_pooled_client
+from scripts.setup._env import log_env_summary
 import logging
 
 
-# Load environment variables
-load_dotenv()
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Log loaded environment variables
-logger.info("Loaded environment variables:")
-logger.info(f"SUPABASE_URL={os.getenv('SUPABASE_URL')}")
-logger.info(f"SUPABASE_DB_URL set={bool(os.getenv('SUPABASE_DB_URL'))}")
-if os.getenv('SUPABASE_KEY'):
-    logger.info(f"SUPABASE_KEY={os.getenv('SUPABASE_KEY')[:6]}... (truncated)")  # avoid leaking full key
-if os.getenv('SUPABASE_SERVICE_KEY'):
-    logger.info(f"SUPABASE_SERVICE_KEY={os.getenv('SUPABASE_SERVICE_KEY')[:6]}... (truncated)")
+
+def bucket_exists(client, bucket_id: str) -> bool:
+    """Check for one bucket directly instead of listing every bucket"""
+    try:
+        client.storage.get_bucket(bucket_id)
+        return True
+    except AttributeError:
+        # Older storage clients without get_bucket
+        return bucket_id in [b.name for b in client.storage.list_buckets()]
+    except Exception as e:
+        # Storage reports a missing bucket as "Bucket not found" (404)
+        if "not found" in str(e).lower():
+            return False
+        raise
 
 
-async def create_storage_bucket():
+def create_storage_bucket():
     """Create the generated-media storage bucket in Supabase"""
+    log_env_summary(logger)
     
-    # Use service key for admin access (bypasses RLS)
-    client = create_client(
-        settings.SUPABASE_URL,
-        settings.SUPABASE_SERVICE_KEY  # Service key has admin privileges
-    )
+    # Shared service-key client for admin access (bypasses RLS)
+    client = get_pooled_client().raw_client()
     
     try:
-        # List existing buckets
-        buckets = client.storage.list_buckets()
-        bucket_names = [b.name for b in buckets]
-        
-        if "generated-media" not in bucket_names:
+        if not bucket_exists(client, "generated-media"):
             # Create the bucket with public access
             client.storage.create_bucket(
                 "generated-media",
@@ -78,4 +71,4 @@ async def create_storage_bucket():
         raise
 
 if __name__ == "__main__":
-    asyncio.run(create_storage_bucket())
\ No newline at end of file
+    create_storage_bucket()
\ No newline at end of file
@@ -1,30 +1,24 @@
 # scripts/setup/init_database.py
 
 import asyncio
-import os
+import random
+import sys
 from pathlib import Path
-from supabase import create_client
-from dotenv import load_dotenv
 import logging
 
-# Load environment variables
-load_dotenv()
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.db.supabase_client import get_pooled_client
+from scripts.setup._env import env, log_env_summary
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Log loaded environment variables
-logger.info("Loaded environment variables:")
-logger.info(f"SUPABASE_URL={os.getenv('SUPABASE_URL')}")
-logger.info(f"SUPABASE_DB_URL set={bool(os.getenv('SUPABASE_DB_URL'))}")
-if os.getenv('SUPABASE_KEY'):
-    logger.info(f"SUPABASE_KEY={os.getenv('SUPABASE_KEY')[:6]}... (truncated)")  # avoid leaking full key
-if os.getenv('SUPABASE_SERVICE_KEY'):
-    logger.info(f"SUPABASE_SERVICE_KEY={os.getenv('SUPABASE_SERVICE_KEY')[:6]}... (truncated)")
-
 
 async def init_database():
     """Initialize database with schema and refresh PostgREST schema cache."""
+    log_env_summary(logger)
     try:
         # --- Load & validate inputs -------------------------------------------------
         migration_file = Path("backend/db/migrations/001_initial_schema.sql")
@@ -35,9 +29,9 @@ async def init_database():
         sql_content = migration_file.read_text()
         logger.info("Database initialization SQL loaded")
 
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_service_key = os.getenv("SUPABASE_SERVICE_KEY")
-        db_url = os.getenv("SUPABASE_DB_URL")
+        supabase_url = env("SUPABASE_URL")
+        supabase_service_key = env("SUPABASE_SERVICE_KEY")
+        db_url = env("SUPABASE_DB_URL")
 
         if not db_url:
             logger.error("SUPABASE_DB_URL not found - needed to apply migrations")
@@ -69,26 +63,37 @@ async def init_database():
             logger.info("Applying database migration...")
             conn = psycopg2.connect(db_url_final, connect_timeout=15)
             conn.autocommit = True  # make DDL + NOTIFY visible immediately
-            with conn.cursor() as cur:
-                cur.execute(sql_content)
-                # Tell PostgREST to refresh its schema cache so REST can see new tables
-                cur.execute("NOTIFY pgrst, 'reload schema';")
-            conn.close()
-            logger.info("Database migration applied successfully and schema reload notified")
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql_content)
+                    # Tell PostgREST to refresh its schema cache so REST can see new tables
+                    cur.execute("NOTIFY pgrst, 'reload schema';")
+                logger.info("Database migration applied successfully and schema reload notified")
+
+                # --- Quick direct DB sanity check on the same connection -----------
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1 FROM public.initiatives LIMIT 1;")
+                        _ = cur.fetchone()  # ignore result; exists -> query OK (0 rows also OK)
+                    logger.info("Direct Postgres sanity check successful")
+                except Exception as e:
+                    logger.warning(f"Direct Postgres sanity check encountered an issue (continuing): {e}")
+            finally:
+                conn.close()
         except Exception as e:
             logger.error(f"Failed to apply migration: {e}")
             return False
 
         # --- Verify via REST (with a brief retry after NOTIFY) ---------------------
-        client = create_client(supabase_url, supabase_service_key)
+        # Shared service-key client (same SUPABASE_URL / SUPABASE_SERVICE_KEY)
+        client = get_pooled_client().raw_client()
 
         def try_rest_once():
             # Use a very light query; empty tables will still return 200
             return client.table("initiatives").select("id").limit(1).execute()
 
         # Short retry loop in case the schema cache takes a moment to refresh
-        import time
-        max_attempts = 4
+        max_attempts = 6
         for attempt in range(1, max_attempts + 1):
             try:
                 _ = try_rest_once()
@@ -98,25 +103,14 @@ async def init_database():
                 msg = str(e)
                 if "PGRST205" in msg or "Could not find the table" in msg:
                     if attempt < max_attempts:
-                        wait = 0.5 * attempt  # 0.5s, 1.0s, 1.5s...
+                        # Exponential backoff with jitter: ~0.2s, 0.4s, 0.8s... capped at 2s
+                        wait = min(0.1 * 2 ** attempt + random.uniform(0, 0.1), 2.0)
                         logger.info(f"Schema not visible yet (attempt {attempt}/{max_attempts}); retrying in {wait:.1f}s...")
-                        time.sleep(wait)
+                        await asyncio.sleep(wait)
                         continue
                 logger.error(f"Supabase REST API connection failed: {e}")
                 return False
 
-        # --- Optional: quick direct DB sanity check --------------------------------
-        try:
-            import psycopg2
-            conn = psycopg2.connect(db_url_final, connect_timeout=10)
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1 FROM public.initiatives LIMIT 1;")
-                _ = cur.fetchone()  # ignore result; exists -> query OK (0 rows also OK)
-            conn.close()
-            logger.info("Direct Postgres sanity check successful")
-        except Exception as e:
-            logger.warning(f"Direct Postgres sanity check encountered an issue (continuing): {e}")
-
         return True
 
     except Exception as e:
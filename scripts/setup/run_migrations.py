@@ -6,34 +6,74 @@ Run all database migrations in order.
 Tracks which migrations have been applied and only runs new ones.
 
 Usage:
-    python scripts/setup/run_migrations.py
+    python scripts/setup/run_migrations.py [--no-cache]
+
+After a successful, verified run the stat of every migration file and a
+digest of schema_migrations are cached in .migration-cache.json; if
+neither changed since, the next run skips the migration and schema checks
+after a single query. Pass --no-cache to always check the database.
 """
 
-import asyncio
+import json
 import os
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import logging
-from dotenv import load_dotenv
 import hashlib
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Load environment variables
-load_dotenv()
+from scripts.setup._env import env
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# SQLSTATE codes of errors that mean a statement was already applied
+IGNORABLE_SQLSTATES = {
+    "42P07": "Table already exists",       # duplicate_table
+    "42710": "Object already exists",      # duplicate_object
+    "42701": "Column already exists",      # duplicate_column
+    "42723": "Function already exists",    # duplicate_function
+    "23505": "Constraint already exists",  # unique_violation
+    "42P16": "Primary key already exists", # invalid_table_definition (multiple primary keys)
+}
+
+# Same check by message, for errors raised without a SQLSTATE
+IDEMPOTENT_ERROR_RE = re.compile(r"already exists|duplicate|multiple primary keys", re.IGNORECASE)
+
+# Pending file count above which files are read in parallel up front
+PREFETCH_MIN_FILES = 5
+
+# Opening delimiter of a dollar-quoted body: $$ or $tag$
+DOLLAR_QUOTE_RE = re.compile(r"\$(?:[A-Za-z_]\w*)?\$")
+
+# Characters that can start a comment, string, dollar quote or end a statement
+SQL_SPECIAL_RE = re.compile(r"[-/'\";$]")
+
+# Opening and closing marks of (possibly nested) block comments
+BLOCK_COMMENT_RE = re.compile(r"/\*|\*/")
+
+# Rest of an E'...' string after the opening quote, through the closing
+# quote (or the end of the input if it is unterminated)
+ESCAPE_STRING_BODY_RE = re.compile(r"(?:[^'\\]|\\.|'')*(?:'|\\?\Z)", re.DOTALL)
+
 
 class MigrationRunner:
     """Handles database migration execution and tracking"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.migrations_dir = Path("backend/db/migrations")
-        self.db_url = os.getenv("SUPABASE_DB_URL")
+        self.cache_file = Path(".migration-cache.json")
+        self.use_cache = use_cache
+        self.cache_hit = False
+        self.db_url = env("SUPABASE_DB_URL")
         
         if not self.db_url:
             raise ValueError(
@@ -43,6 +83,22 @@ class MigrationRunner:
         
         # Ensure SSL mode
         self.db_url = self._ensure_sslmode(self.db_url)
+        
+        # One connection shared by every step of the run
+        self._conn = None
+        
+        # version -> checksum of applied migrations, loaded once per run
+        self._applied = None
+        
+        # Connection the record_migration statement is prepared on
+        self._prepared_conn = None
+    
+    def __enter__(self):
+        # The connection is opened lazily, on the first query
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def _ensure_sslmode(self, url: str) -> str:
         """Ensure the database URL includes sslmode=require"""
@@ -52,8 +108,51 @@ class MigrationRunner:
         return f"{url}{sep}sslmode=require"
     
     def get_connection(self):
-        """Get a database connection"""
-        return psycopg2.connect(self.db_url, cursor_factory=RealDictCursor)
+        """Get the shared database connection, opening it on first use"""
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg2.connect(
+                self.db_url,
+                cursor_factory=RealDictCursor,
+                connect_timeout=15
+            )
+        return self._conn
+    
+    def close(self):
+        """Close the shared database connection"""
+        if self._conn is not None and not self._conn.closed:
+            self._conn.close()
+        self._conn = None
+        self._prepared_conn = None  # prepared statements die with the session
+    
+    def _reconnect(self):
+        """Drop the current connection and open a fresh one"""
+        try:
+            self.close()
+        except psycopg2.Error:
+            self._conn = None
+        return self.get_connection()
+    
+    def _query(self, sql: str, params: tuple = None, fetch: bool = True, as_tuples: bool = False) -> list:
+        """
+        Run an idempotent query on the shared connection and commit.
+        A dropped connection is reopened and the query retried with backoff.
+        With as_tuples, rows are plain tuples instead of RealDictCursor dicts.
+        """
+        cursor_factory = psycopg2.extensions.cursor if as_tuples else None
+        for delay in (0.5, 1, 2, None):
+            try:
+                conn = self.get_connection()
+                with conn.cursor(cursor_factory=cursor_factory) as cur:
+                    cur.execute(sql, params)
+                    rows = cur.fetchall() if fetch else []
+                conn.commit()
+                return rows
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if delay is None:
+                    raise
+                logger.warning(f"  ⚠️  Connection problem ({e}); reconnecting in {delay}s")
+                time.sleep(delay)
+                self._reconnect()
     
     def create_migrations_table(self):
         """Create the migrations tracking table if it doesn't exist"""
@@ -68,233 +167,440 @@ class MigrationRunner:
         );
         """
         
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(create_table_sql)
-            conn.commit()
-            logger.info("✓ Migrations table ready")
+        self._query(create_table_sql, fetch=False)
+        logger.info("✓ Migrations table ready")
     
-    def get_applied_migrations(self) -> set:
-        """Get list of already applied migrations"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT version FROM schema_migrations WHERE success = true"
-                )
-                results = cur.fetchall()
-                return {row['version'] for row in results}
+    def get_applied_migrations(self) -> dict:
+        """Get already applied migrations as {version: checksum}, cached for the run"""
+        if self._applied is None:
+            results = self._query(
+                "SELECT version, checksum FROM schema_migrations WHERE success = true",
+                as_tuples=True
+            )
+            self._applied = dict(results)
+        return self._applied
+    
+    def _migration_entries(self) -> list:
+        """Migration files as os.DirEntry objects, sorted by name (one directory scan)"""
+        with os.scandir(self.migrations_dir) as it:
+            entries = [e for e in it if e.name.endswith(".sql") and e.is_file()]
+        entries.sort(key=lambda e: e.name)
+        return entries
     
     def get_pending_migrations(self) -> list:
         """Get list of migrations that need to be applied"""
         applied = self.get_applied_migrations()
         
-        # Get all migration files
-        migration_files = sorted([
-            f for f in self.migrations_dir.glob("*.sql")
-            if f.is_file()
-        ])
+        return [
+            Path(entry.path) for entry in self._migration_entries()
+            if entry.name[:-len(".sql")] not in applied  # version = filename without extension
+        ]
+    
+    @staticmethod
+    def compute_checksum(sql_bytes: bytes) -> str:
+        """BLAKE2b-256 hex digest of a migration file's raw bytes (fits checksum VARCHAR(64))"""
+        return hashlib.blake2b(sql_bytes, digest_size=32).hexdigest()
+    
+    def check_migration_checksum(self, version: str, sql_bytes: bytes) -> bool:
+        """Check if a migration's content matches what was previously applied"""
+        stored_checksum = self.get_applied_migrations().get(version)
+        if not stored_checksum:
+            return True  # If no checksum stored, assume it's ok
+        if len(stored_checksum) == 32:
+            # Recorded by an older runner that used MD5 over the newline-normalized text
+            text = sql_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            return stored_checksum == hashlib.md5(text.encode()).hexdigest()
+        return stored_checksum == self.compute_checksum(sql_bytes)
+    
+    def _cache_key(self) -> str:
+        """Identify the target database without storing its credentials"""
+        return hashlib.blake2b(self.db_url.encode(), digest_size=16).hexdigest()
+    
+    def _file_stats(self) -> dict:
+        """Map each migration file name to [mtime_ns, size]"""
+        stats = {}
+        for entry in self._migration_entries():
+            st = entry.stat()
+            stats[entry.name] = [st.st_mtime_ns, st.st_size]
+        return stats
+    
+    def _migrations_digest(self) -> Optional[str]:
+        """
+        Fingerprint of the applied migrations as recorded on the server, so
+        a reset, restored or elsewhere-migrated database invalidates the
+        cache. None if schema_migrations doesn't exist yet.
+        """
+        try:
+            rows = self._query("""
+                SELECT count(*), md5(coalesce(
+                    string_agg(version || ':' || coalesce(checksum, ''), ',' ORDER BY version), ''
+                ))
+                FROM schema_migrations WHERE success = true
+            """, as_tuples=True)
+        except psycopg2.ProgrammingError:
+            self.get_connection().rollback()
+            return None
+        count, digest = rows[0]
+        return f"{count}:{digest}"
+    
+    def _cache_is_current(self) -> bool:
+        """
+        True if no migration file changed since the last verified run on
+        this database and the database's migration history is unchanged.
+        The local stats are compared first, so a stale cache never queries.
+        """
+        try:
+            cache = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return False
+        if cache.get("db") != self._cache_key() or cache.get("files") != self._file_stats():
+            return False
+        digest = cache.get("migrations")
+        return digest is not None and digest == self._migrations_digest()
+    
+    def save_cache(self):
+        """Record the current migration files and migration history for this database"""
+        cache = {
+            "db": self._cache_key(),
+            "files": self._file_stats(),
+            "migrations": self._migrations_digest()
+        }
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(cache, indent=2))
+        os.replace(tmp_file, self.cache_file)  # atomic swap
+    
+    @staticmethod
+    def split_sql_statements(sql_content: str) -> list:
+        """
+        Split SQL content into individual statements in a single pass.
+        Semicolons inside comments (block comments may nest), quoted
+        strings, E'...' strings with backslash escapes and dollar-quoted
+        bodies ($$ ... $$ or $tag$ ... $tag$) do not end a statement.
+        """
+        statements = []
+        start = 0
+        has_code = False
+        i = 0
+        n = len(sql_content)
+        
+        while i < n:
+            # Jump straight to the next character that can change state
+            match = SQL_SPECIAL_RE.search(sql_content, i)
+            j = match.start() if match else n
+            if not has_code and j > i and not sql_content[i:j].isspace():
+                has_code = True
+            if match is None:
+                break
+            i = j
+            ch = sql_content[i]
+            
+            if ch == '-' and sql_content.startswith('--', i):
+                end = sql_content.find('\n', i)
+                i = n if end == -1 else end + 1
+                continue
+            if ch == '/' and sql_content.startswith('/*', i):
+                # Block comments nest: /* outer /* inner */ still outer */
+                depth = 0
+                for mark in BLOCK_COMMENT_RE.finditer(sql_content, i):
+                    depth += 1 if mark.group() == '/*' else -1
+                    if depth == 0:
+                        i = mark.end()
+                        break
+                else:
+                    i = n
+                continue
+            if ch == "'" and i > 0 and sql_content[i - 1] in 'Ee' and (
+                i == 1 or not (sql_content[i - 2].isalnum() or sql_content[i - 2] in '_$')
+            ):
+                # E'...' escape string: a backslash escapes the next character
+                match = ESCAPE_STRING_BODY_RE.match(sql_content, i + 1)
+                i = match.end()
+                has_code = True
+                continue
+            if ch == "'" or ch == '"':
+                # A doubled quote ('' or "") just closes and reopens the string
+                end = sql_content.find(ch, i + 1)
+                i = n if end == -1 else end + 1
+                has_code = True
+                continue
+            if ch == '$':
+                match = DOLLAR_QUOTE_RE.match(sql_content, i)
+                if match:
+                    tag = match.group()
+                    end = sql_content.find(tag, match.end())
+                    i = n if end == -1 else end + len(tag)
+                    has_code = True
+                    continue
+            
+            if ch == ';':
+                if has_code:
+                    statements.append(sql_content[start:i + 1].strip())
+                start = i + 1
+                has_code = False
+            else:
+                has_code = True
+            i += 1
         
-        pending = []
-        for file in migration_files:
-            version = file.stem  # filename without extension
-            if version not in applied:
-                pending.append(file)
+        # Trailing statement without a semicolon
+        if has_code:
+            statements.append(sql_content[start:].strip())
         
-        return pending
+        return statements
     
-    def check_migration_checksum(self, version: str, new_checksum: str) -> bool:
-        """Check if a migration's checksum matches what was previously applied"""
-        with self.get_connection() as conn:
+    def _record_migration(self, conn, version: str, checksum: str, execution_time: int):
+        """
+        Upsert the schema_migrations row in the current transaction. The
+        statement is prepared the first time it is needed on a connection,
+        so later migrations skip parse/plan. The connection only counts as
+        prepared once that batch has run successfully.
+        """
+        prefix = "" if self._prepared_conn is conn else """
+            PREPARE record_migration (varchar, varchar, integer) AS
+            INSERT INTO schema_migrations 
+            (version, checksum, execution_time_ms, success)
+            VALUES ($1, $2, $3, true)
+            ON CONFLICT (version) 
+            DO UPDATE SET 
+                checksum = EXCLUDED.checksum,
+                execution_time_ms = EXCLUDED.execution_time_ms,
+                success = true,
+                applied_at = CURRENT_TIMESTAMP;
+        """
+        try:
             with conn.cursor() as cur:
                 cur.execute(
-                    "SELECT checksum FROM schema_migrations WHERE version = %s AND success = true",
-                    (version,)
+                    prefix + "EXECUTE record_migration (%s, %s, %s);",
+                    (version, checksum, execution_time)
                 )
-                result = cur.fetchone()
-                if result and result['checksum']:
-                    return result['checksum'] == new_checksum
-        return True  # If no checksum stored, assume it's ok
+        except psycopg2.Error:
+            if prefix:
+                self._sync_prepared_state(conn)
+            raise
+        self._prepared_conn = conn
     
-    def split_sql_statements(self, sql_content: str) -> list:
+    def _sync_prepared_state(self, conn):
         """
-        Split SQL content into individual statements.
-        This handles DO $$ blocks and other multi-line statements properly.
+        After a failed PREPARE batch, find out whether record_migration exists.
+        PREPARE is not undone by a rollback, so it may have succeeded even
+        though the EXECUTE after it failed.
         """
-        # Remove comments
-        sql_content = re.sub(r'--.*$', '', sql_content, flags=re.MULTILINE)
+        self._prepared_conn = None
+        try:
+            conn.rollback()
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1 FROM pg_prepared_statements WHERE name = 'record_migration'")
+                if cur.fetchone():
+                    self._prepared_conn = conn
+            conn.commit()
+        except psycopg2.Error:
+            pass  # Broken connection: the next one gets a fresh PREPARE
+    
+    def _apply_statements(self, conn, statements: list) -> tuple:
+        """
+        Apply statements one at a time in the current transaction, skipping
+        ones that fail because the object already exists. Each statement
+        is wrapped in a savepoint (sent in the same round-trip), so a
+        failure only undoes that statement. The rollback for a failed
+        statement is sent with the next statement rather than as its own
+        round-trip. The caller commits.
         
-        # Split by semicolon, but not within DO blocks or strings
-        statements = []
-        current_statement = []
-        in_do_block = False
-        in_string = False
-        escape_next = False
-        
-        for line in sql_content.split('\n'):
-            line = line.strip()
-            if not line:
+        Returns:
+            (statements_applied, statements_skipped, errors_encountered)
+        """
+        errors_encountered = []
+        statements_applied = 0
+        statements_skipped = 0
+        total_statements = len(statements)
+        rollback = "ROLLBACK TO SAVEPOINT migration_statement;\n"
+        pending_rollback = ""
+        
+        for i, statement in enumerate(statements, 1):
+            if not statement.strip():
                 continue
                 
-            # Track DO blocks
-            if 'DO $$' in line:
-                in_do_block = True
-            elif '$$;' in line and in_do_block:
-                in_do_block = False
-                current_statement.append(line)
-                statements.append('\n'.join(current_statement))
-                current_statement = []
-                continue
-            
-            # For regular statements
-            if not in_do_block and line.endswith(';'):
-                current_statement.append(line)
-                statements.append('\n'.join(current_statement))
-                current_statement = []
-            else:
-                current_statement.append(line)
-        
-        # Add any remaining statement
-        if current_statement:
-            statements.append('\n'.join(current_statement))
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"{pending_rollback}SAVEPOINT migration_statement;\n{statement}\n;"
+                        "RELEASE SAVEPOINT migration_statement;"
+                    )
+                    pending_rollback = ""
+                    statements_applied += 1
+                    
+            except Exception as e:
+                if conn.closed:
+                    raise  # Connection lost: the transaction is gone with it
+                pending_rollback = rollback
+                error_msg = str(e)
+                
+                # Check if it's an ignorable error: by SQLSTATE, falling back
+                # to the message for errors that carry no code
+                reason = IGNORABLE_SQLSTATES.get(getattr(e, "pgcode", None))
+                if reason is None and IDEMPOTENT_ERROR_RE.search(error_msg):
+                    reason = "Skipping"
+                
+                if reason:
+                    statements_skipped += 1
+                    logger.debug(f"    {reason} (statement {i}/{total_statements}): {error_msg[:100]}")
+                else:
+                    errors_encountered.append(f"Statement {i}: {error_msg}")
+                    logger.error(f"    ✗ Error in statement {i}/{total_statements}: {error_msg}")
         
-        return [s.strip() for s in statements if s.strip()]
+        if pending_rollback:
+            with conn.cursor() as cur:
+                cur.execute(pending_rollback)
+        return statements_applied, statements_skipped, errors_encountered
     
-    def run_migration(self, migration_file: Path) -> bool:
+    def run_migration(self, migration_file: Path, sql_bytes: bytes = None) -> bool:
         """
-        Run a single migration file statement by statement
+        Run a single migration file, as one batch when possible
         
         Args:
             migration_file: Path to the migration SQL file
+            sql_bytes: File contents if already read (see prefetch_migrations)
             
         Returns:
             True if successful, False otherwise
         """
         version = migration_file.stem
+        already_applied = version in self.get_applied_migrations()
         
-        # Read migration content
+        # Read the file once: the raw bytes are hashed, then decoded once for execution
         try:
-            sql_content = migration_file.read_text()
+            if sql_bytes is None:
+                sql_bytes = migration_file.read_bytes()
         except Exception as e:
             logger.error(f"  ✗ Error reading migration file: {e}")
             return False
         
-        # Calculate checksum
-        checksum = hashlib.md5(sql_content.encode()).hexdigest()
-        
-        # Check if already applied
-        applied_migrations = self.get_applied_migrations()
-        if version in applied_migrations:
-            if not self.check_migration_checksum(version, checksum):
+        # Already applied: only check for drift (a single hash), don't execute
+        if already_applied:
+            if not self.check_migration_checksum(version, sql_bytes):
                 logger.warning(f"  ⚠️  {version} already applied but content has changed")
                 logger.info("     Consider creating a new migration file for changes")
             else:
                 logger.info(f"  ✓ {version} already applied - skipping")
             return True
         
+        try:
+            sql_content = sql_bytes.decode("utf-8")
+        except UnicodeDecodeError as e:
+            logger.error(f"  ✗ Error reading migration file: {e}")
+            return False
+        
+        # Calculate checksum
+        checksum = self.compute_checksum(sql_bytes)
+        
         logger.info(f"\nRunning migration: {version}")
         
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
+        
+        # Individual statements for the per-statement fallback
+        statements = self.split_sql_statements(sql_content)
+        
+        # Nothing is committed until the migration is recorded, so a
+        # dropped connection can be reopened and the migration run again
+        for delay in (1, None):
+            try:
+                return self._apply_migration(version, sql_content, statements, checksum, start_ns)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if delay is None or (self._conn is not None and not self._conn.closed):
+                    raise
+                logger.warning(f"  ⚠️  Connection lost while applying {version} ({e}); reconnecting in {delay}s")
+                time.sleep(delay)
+                self._reconnect()
+    
+    def _apply_migration(self, version: str, sql_content: str, statements: list,
+                         checksum: str, start_ns: int) -> bool:
+        """
+        Apply one migration and record it on the shared connection.
+        Connection errors propagate to run_migration, which reconnects.
+        """
         errors_encountered = []
         statements_applied = 0
         statements_skipped = 0
-        
-        # Split into individual statements and run each
-        statements = self.split_sql_statements(sql_content)
         total_statements = len(statements)
         
         with self.get_connection() as conn:
-            for i, statement in enumerate(statements, 1):
-                if not statement.strip():
-                    continue
-                    
-                try:
-                    with conn.cursor() as cur:
-                        cur.execute(statement)
-                        conn.commit()
-                        statements_applied += 1
-                        
-                except psycopg2.errors.DuplicateTable as e:
-                    conn.rollback()
-                    statements_skipped += 1
-                    logger.debug(f"    Table already exists (statement {i}/{total_statements})")
-                    
-                except psycopg2.errors.DuplicateObject as e:
-                    conn.rollback()
-                    statements_skipped += 1
-                    logger.debug(f"    Object already exists (statement {i}/{total_statements})")
-                    
-                except psycopg2.errors.DuplicateColumn as e:
-                    conn.rollback()
-                    statements_skipped += 1
-                    logger.debug(f"    Column already exists (statement {i}/{total_statements})")
-                    
-                except psycopg2.errors.UniqueViolation as e:
-                    conn.rollback()
-                    statements_skipped += 1
-                    logger.debug(f"    Constraint already exists (statement {i}/{total_statements})")
-                    
-                except Exception as e:
-                    conn.rollback()
-                    error_msg = str(e)
-                    
-                    # Check if it's an ignorable error
-                    if any(phrase in error_msg.lower() for phrase in [
-                        "already exists", "duplicate", "multiple primary keys"
-                    ]):
-                        statements_skipped += 1
-                        logger.debug(f"    Skipping (statement {i}/{total_statements}): {error_msg[:100]}")
-                    else:
-                        errors_encountered.append(f"Statement {i}: {error_msg}")
-                        logger.error(f"    ✗ Error in statement {i}/{total_statements}: {error_msg}")
+            # Fast path: send the whole file as one batch (one round-trip).
+            # If anything fails, roll back and apply statement by statement
+            # so "already exists" errors from a partially applied migration
+            # can be skipped. Either way the migration and its
+            # schema_migrations record are committed together, once.
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql_content)
+                statements_applied = total_statements
+            except psycopg2.DatabaseError as e:
+                if conn.closed:
+                    raise  # Connection lost, not a statement error
+                conn.rollback()
+                logger.debug(f"    Batch apply failed, retrying per statement: {str(e)[:100]}")
+                statements_applied, statements_skipped, errors_encountered = (
+                    self._apply_statements(conn, statements)
+                )
             
             # Calculate execution time
-            execution_time = int(
-                (datetime.now() - start_time).total_seconds() * 1000
-            )
+            execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             # Determine if migration was successful
             success = len(errors_encountered) == 0 and (statements_applied > 0 or statements_skipped > 0)
             
             if success:
-                # Record successful migration
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO schema_migrations 
-                        (version, checksum, execution_time_ms, success)
-                        VALUES (%s, %s, %s, true)
-                        ON CONFLICT (version) 
-                        DO UPDATE SET 
-                            checksum = EXCLUDED.checksum,
-                            execution_time_ms = EXCLUDED.execution_time_ms,
-                            success = true,
-                            applied_at = CURRENT_TIMESTAMP
-                    """, (version, checksum, execution_time))
-                    
-                    # Notify PostgREST to reload schema
-                    cur.execute("NOTIFY pgrst, 'reload schema';")
+                # Record successful migration in the same transaction
+                # (PostgREST is notified once, after the whole run)
+                self._record_migration(conn, version, checksum, execution_time)
                 
                 conn.commit()
+                self._applied[version] = checksum
                 
                 logger.info(f"  ✓ {version} completed successfully")
                 logger.info(f"    Applied: {statements_applied} statements, Skipped: {statements_skipped} statements")
                 logger.info(f"    Time: {execution_time}ms")
                 return True
             else:
+                # Keep the statements that did apply, as before
+                conn.commit()
                 logger.error(f"  ✗ {version} failed with {len(errors_encountered)} errors")
                 for error in errors_encountered[:5]:  # Show first 5 errors
                     logger.error(f"    - {error}")
                 return False
     
+    def prefetch_migrations(self, files: list) -> dict:
+        """
+        Read many migration files concurrently so slow (network or container)
+        mounts don't serialize the run. Returns {path: bytes}; files that
+        can't be read are left out and reported by run_migration.
+        """
+        if len(files) <= PREFETCH_MIN_FILES:
+            return {}
+        
+        def read(path):
+            try:
+                return path, path.read_bytes()
+            except OSError:
+                return path, None
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return {path: data for path, data in pool.map(read, files) if data is not None}
+    
     def run_all_migrations(self):
         """Run all pending migrations"""
         logger.info("="*60)
         logger.info("DATABASE MIGRATION RUNNER")
         logger.info("="*60)
         
+        if self.use_cache and self._cache_is_current():
+            self.cache_hit = True
+            logger.info("\n✅ No migration files or applied migrations changed since the last verified run - skipping database checks")
+            return True
+        
         # Ensure migrations table exists
         self.create_migrations_table()
         
-        # Get pending migrations
+        # Reload the applied set once per run (a reused runner may be stale),
+        # then every check below reads the cached copy
+        self._applied = None
         pending = self.get_pending_migrations()
         
         if not pending:
@@ -309,8 +615,10 @@ class MigrationRunner:
         success_count = 0
         failed_count = 0
         
+        prefetched = self.prefetch_migrations(pending)
+        
         for migration_file in pending:
-            result = self.run_migration(migration_file)
+            result = self.run_migration(migration_file, prefetched.pop(migration_file, None))
             if result:
                 success_count += 1
             else:
@@ -319,6 +627,10 @@ class MigrationRunner:
                 logger.error("Stopping migration process due to failure")
                 break
         
+        if success_count:
+            # One schema reload for PostgREST covers every applied migration
+            self._query("NOTIFY pgrst, 'reload schema';", fetch=False)
+        
         # Summary
         logger.info("\n" + "="*60)
         if failed_count == 0:
@@ -347,76 +659,78 @@ class MigrationRunner:
             'agent_memories'
         ]
         
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                for table in tables_to_check:
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT 1 FROM information_schema.tables 
-                            WHERE table_schema = 'public' 
-                            AND table_name = %s
-                        )
-                    """, (table,))
-                    exists = cur.fetchone()['exists']
-                    
-                    if exists:
-                        logger.info(f"  ✓ Table '{table}' exists")
-                    else:
-                        logger.error(f"  ✗ Table '{table}' missing!")
-                        all_valid = False
+        tables_needing_initiative_id = ['ad_sets', 'posts', 'metrics', 'agent_memories']
+        
+        # All three checks in one round-trip, tagged by kind
+        rows = self._query("""
+            SELECT 'table' AS kind, table_name AS name
+            FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_name = ANY(%s)
+            UNION ALL
+            SELECT 'encrypted_column', column_name 
+            FROM information_schema.columns 
+            WHERE table_name = 'initiative_tokens' 
+            AND column_name LIKE '%%_encrypted'
+            UNION ALL
+            SELECT 'initiative_id', table_name 
+            FROM information_schema.columns 
+            WHERE table_name = ANY(%s) 
+            AND column_name = 'initiative_id'
+        """, (tables_to_check, tables_needing_initiative_id))
+        
+        found = {'table': set(), 'encrypted_column': [], 'initiative_id': set()}
+        for row in rows:
+            if row['kind'] == 'encrypted_column':
+                found['encrypted_column'].append(row['name'])
+            else:
+                found[row['kind']].add(row['name'])
+        
+        for table in tables_to_check:
+            if table in found['table']:
+                logger.info(f"  ✓ Table '{table}' exists")
+            else:
+                logger.error(f"  ✗ Table '{table}' missing!")
+                all_valid = False
         
         # Check for encrypted token columns
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'initiative_tokens' 
-                    AND column_name LIKE '%_encrypted'
-                """)
-                encrypted_cols = [row['column_name'] for row in cur.fetchall()]
-                
-                if encrypted_cols:
-                    logger.info(f"\n  ✓ Found {len(encrypted_cols)} encrypted token columns")
-                    for col in encrypted_cols:
-                        logger.debug(f"    - {col}")
-                else:
-                    logger.warning("  ⚠️  No encrypted token columns found")
-                    all_valid = False
+        encrypted_cols = found['encrypted_column']
+        if encrypted_cols:
+            logger.info(f"\n  ✓ Found {len(encrypted_cols)} encrypted token columns")
+            for col in encrypted_cols:
+                logger.debug(f"    - {col}")
+        else:
+            logger.warning("  ⚠️  No encrypted token columns found")
+            all_valid = False
         
         # Check for initiative_id in all dependent tables
-        tables_needing_initiative_id = ['ad_sets', 'posts', 'metrics', 'agent_memories']
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                for table in tables_needing_initiative_id:
-                    cur.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_name = %s 
-                        AND column_name = 'initiative_id'
-                    """, (table,))
-                    
-                    if cur.fetchone():
-                        logger.info(f"  ✓ Table '{table}' has initiative_id column")
-                    else:
-                        logger.error(f"  ✗ Table '{table}' missing initiative_id column!")
-                        all_valid = False
+        for table in tables_needing_initiative_id:
+            if table in found['initiative_id']:
+                logger.info(f"  ✓ Table '{table}' has initiative_id column")
+            else:
+                logger.error(f"  ✗ Table '{table}' missing initiative_id column!")
+                all_valid = False
         
         return all_valid
 
 
-async def main():
+def main():
     """Main entry point"""
     try:
-        runner = MigrationRunner()
-        
-        # Run all migrations
-        success = runner.run_all_migrations()
+        with MigrationRunner(use_cache="--no-cache" not in sys.argv) as runner:
+            # Run all migrations
+            success = runner.run_all_migrations()
+            
+            if runner.cache_hit:
+                # Verified on the run that wrote the cache
+                schema_valid = True
+            else:
+                # Verify schema on the same connection
+                schema_valid = runner.verify_schema() if success else False
+                if schema_valid:
+                    runner.save_cache()
         
         if success:
-            # Verify schema
-            schema_valid = runner.verify_schema()
-            
             if schema_valid:
                 logger.info("\n✅ All migrations completed and schema verified!")
                 logger.info("\nYour database is ready for use.")
@@ -435,4 +749,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,15 +1,17 @@
 # tests/test_content_generation.py
 
 """
-Tests for social media content generation and posting tools.
+Tests for social media content generation and the posting executors.
 Uses test initiative with pre-configured tokens.
 
 Usage:
-    pytest tests/test_content_generation.py -v                          # Run all tests
-    pytest tests/test_content_generation.py::test_instagram_image_post  # Run specific test
+    pytest tests/test_content_generation.py -v                          # Run fast tests only
+    RUN_SLOW_TESTS=true pytest tests/test_content_generation.py -v      # Run all tests
+    RUN_SLOW_TESTS=true pytest tests/test_content_generation.py::test_instagram_image_post  # Run specific test
     python tests/test_content_generation.py --test image               # Run image tests only
     python tests/test_content_generation.py --test video               # Run video tests only
     python tests/test_content_generation.py --test existing-video      # Test with existing video
+    python tests/test_content_generation.py --concurrency 1            # Run one test at a time
 """
 
 import sys
@@ -21,22 +23,21 @@ import pytest
 import asyncio
 import os
 import argparse
+import hashlib
+import inspect
 from uuid import UUID
 from datetime import datetime
 from pathlib import Path
 import logging
 import sys
 from typing import List
+import aiohttp
 
-from agents.content_creator.tools.social_media_posting import (
-    instagram_image_post_tool,
-    instagram_reel_post_tool,
-    facebook_text_link_post_tool,
-    facebook_image_post_tool,
-    facebook_video_post_tool
-)
-from agents.content_creator.tools.models import PostStatus
+from agents.content_creator.tools.base_executor import PostingStatus
+from agents.content_creator.tools.facebook_executor import FacebookExecutor
+from agents.content_creator.tools.instagram_executor import InstagramExecutor
 from backend.services.media_generation import (
+    MediaGenerationService,
     ImageGenerationService,
     VideoGenerationService
 )
@@ -56,9 +57,21 @@ TEST_CONFIG = {
     "generation_timeout": 180,  # Increased timeout for video generation
     "posting_timeout": 60,
     "retry_attempts": 3,
-    "use_placeholders": os.getenv("USE_PLACEHOLDER_MEDIA", "false").lower() == "true"
+    "use_placeholders": os.getenv("USE_PLACEHOLDER_MEDIA", "false").lower() == "true",
+    "run_slow": os.getenv("RUN_SLOW_TESTS", "false").lower() == "true"
 }
 
+# Generation and posting tests wait minutes on live Wavespeed/Meta APIs;
+# pytest skips them unless RUN_SLOW_TESTS=true (the CLI runner always runs them)
+slow = pytest.mark.skipif(
+    not TEST_CONFIG["run_slow"],
+    reason="slow end-to-end test; set RUN_SLOW_TESTS=true to run"
+)
+
+# Downloaded test media, reused across runs (ignored by git with .pytest_cache)
+MEDIA_CACHE_DIR = Path(__file__).parent.parent / ".pytest_cache" / "media"
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 
 @pytest.fixture
 def initiative_id():
@@ -66,6 +79,18 @@ def initiative_id():
     return str(TEST_INITIATIVE_ID)
 
 
+@pytest.fixture(scope="session")
+def image_service():
+    """One image generation service (and its Supabase client) for the whole session"""
+    return ImageGenerationService()
+
+
+@pytest.fixture(scope="session")
+def video_service():
+    """One video generation service (and its Supabase client) for the whole session"""
+    return VideoGenerationService()
+
+
 @pytest.fixture
 def media_urls_list():
     """Fixture to store generated media URLs for cleanup"""
@@ -76,12 +101,11 @@ def media_urls_list():
         logger.info(f"Generated media URL: {url}")
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"])
-async def test_image_generation_service(initiative_id):
+async def test_image_generation_service(image_service, initiative_id):
     """Test image generation service with Wavespeed"""
-    service = ImageGenerationService()
-    
     prompts = [
         "A serene landscape with mountains and a lake at sunset, photorealistic, 4k quality",
         "Modern minimalist office space with natural lighting, architectural photography"
@@ -91,7 +115,7 @@ async def test_image_generation_service(initiative_id):
     logger.debug(f"Using initiative_id: {initiative_id}")
     logger.debug(f"Prompts: {prompts}")
     
-    urls = await service.generate_images(
+    urls = await image_service.generate_images(
         prompts=prompts,
         initiative_id=UUID(initiative_id),
         num_per_prompt=1
@@ -105,19 +129,18 @@ async def test_image_generation_service(initiative_id):
         logger.info(f"✅ Generated image: {url}")
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"] * 2)
-async def test_video_generation_service(initiative_id):
+async def test_video_generation_service(video_service, initiative_id):
     """Test video generation service with Wavespeed"""
-    service = VideoGenerationService()
-    
     prompt = "Time-lapse of a city skyline transitioning from day to night, cinematic"
     
     logger.info("Starting video generation test...")
     logger.debug(f"Using initiative_id: {initiative_id}")
     logger.debug(f"Prompt: {prompt}")
     
-    url = await service.generate_video(
+    url = await video_service.generate_video(
         prompt=prompt,
         initiative_id=UUID(initiative_id),
         duration_sec=5
@@ -129,6 +152,35 @@ async def test_video_generation_service(initiative_id):
     logger.info(f"✅ Generated video: {url}")
 
 
+async def _download_cached(url: str) -> bytes:
+    """Download a media file once; later runs read it from MEDIA_CACHE_DIR"""
+    cache_file = MEDIA_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+    if cache_file.exists():
+        logger.debug(f"Using cached download for: {url}")
+        return cache_file.read_bytes()
+    
+    async with aiohttp.ClientSession() as session:
+        logger.debug(f"Attempting to download video from: {url}")
+        async with session.get(url) as response:
+            logger.debug(f"Response status: {response.status}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
+            
+            if response.status != 200:
+                logger.error(f"Failed to download video: HTTP {response.status}")
+                assert False, f"Video download failed with status {response.status}"
+            
+            # Stream straight into the cache instead of buffering the whole body
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "wb") as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+    
+    os.replace(tmp_file, cache_file)  # atomic swap
+    return cache_file.read_bytes()
+
+
+@slow
 @pytest.mark.asyncio
 async def test_with_existing_video(initiative_id):
     """Test posting with a known working video URL"""
@@ -137,195 +189,200 @@ async def test_with_existing_video(initiative_id):
     # Use the known working video URL
     existing_video_url = "https://d2p7pge43lyniu.cloudfront.net/output/9f84e4e8-733d-41b7-aeae-c44ad983965c-u1_05fb4e0f-58ba-4444-8209-4c3ed2554a97.mp4"
     
-    # Test direct video download
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
-        logger.debug(f"Attempting to download video from: {existing_video_url}")
-        async with session.get(existing_video_url) as response:
-            logger.debug(f"Response status: {response.status}")
-            logger.debug(f"Response headers: {dict(response.headers)}")
-            
-            if response.status == 200:
-                video_bytes = await response.read()
-                logger.info(f"✅ Successfully downloaded video: {len(video_bytes)} bytes")
-                
-                # Now try to upload to Supabase and post
-                from backend.services.media_generation import MediaGenerationService
-                service = MediaGenerationService()
-                
-                public_url = await service._upload_to_supabase(
-                    file_bytes=video_bytes,
-                    initiative_id=UUID(initiative_id),
-                    media_type="videos",
-                    file_extension="mp4",
-                    content_type="video/mp4",
-                    metadata={
-                        "test": "existing_video",
-                        "original_url": existing_video_url
-                    }
-                )
-                
-                logger.info(f"✅ Uploaded to Supabase: {public_url}")
-                
-                # Test posting to Instagram as Reel
-                logger.info("Testing Instagram Reel post with existing video...")
-                # Note: This would need modification to accept pre-generated video URL
-                # For now, just verify the download and upload worked
-                
-            else:
-                logger.error(f"Failed to download video: HTTP {response.status}")
-                assert False, f"Video download failed with status {response.status}"
+    # Test direct video download (cached on disk after the first run)
+    video_bytes = await _download_cached(existing_video_url)
+    logger.info(f"✅ Successfully downloaded video: {len(video_bytes)} bytes")
+    
+    # Now try to upload to Supabase and post
+    service = MediaGenerationService()
+    
+    public_url = await service._upload_to_supabase(
+        file_bytes=video_bytes,
+        initiative_id=UUID(initiative_id),
+        media_type="videos",
+        file_extension="mp4",
+        content_type="video/mp4",
+        metadata={
+            "test": "existing_video",
+            "original_url": existing_video_url
+        }
+    )
+    
+    logger.info(f"✅ Uploaded to Supabase: {public_url}")
+    
+    # Test posting to Instagram as Reel
+    logger.info("Testing Instagram Reel post with existing video...")
+    # Note: This would need modification to accept pre-generated video URL
+    # For now, just verify the download and upload worked
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"] + TEST_CONFIG["posting_timeout"])
 async def test_instagram_image_post(initiative_id, media_urls_list):
     """Test posting a single image to Instagram with generation"""
     logger.info("Starting Instagram image post test...")
     
-    result = await instagram_image_post_tool._arun(
-        initiative_id=initiative_id,
-        caption="Testing automated image post with Wavespeed AI! 🚀",
-        tags=["aiart", "automation", "wavespeed"],
-        image_prompts=["A futuristic robot artist painting on a holographic canvas, digital art style"],
-        is_carousel=False,
-        metadata={"test_run": True, "timestamp": datetime.utcnow().isoformat()}
-    )
+    result = await InstagramExecutor(initiative_id).execute({
+        "post_id": "test_ig_image",
+        "post_type": "image",
+        "content": {
+            "caption": "Testing automated image post with Wavespeed AI! 🚀",
+            "hashtags": ["aiart", "automation", "wavespeed"]
+        },
+        # The executors take the generation prompt in the media "url"
+        "media": [{"url": "A futuristic robot artist painting on a holographic canvas, digital art style"}]
+    })
     
     logger.debug(f"Post result: {result}")
     assert result.success is True, f"Post should succeed: {result.error_message}"
-    assert result.status == PostStatus.PUBLISHED
+    assert result.status == PostingStatus.PUBLISHED
     assert result.platform == "instagram"
-    assert result.post_id is not None
-    assert result.post_url is not None
-    assert len(result.media_files) == 1
+    assert result.platform_post_id is not None
+    assert result.platform_url is not None
+    assert len(result.media_urls) == 1
     
-    logger.info(f"✅ Successfully posted to Instagram: {result.post_url}")
-    media_urls_list.extend([mf.public_url for mf in result.media_files])
+    logger.info(f"✅ Successfully posted to Instagram: {result.platform_url}")
+    media_urls_list.extend(result.media_urls)
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"] * 3 + TEST_CONFIG["posting_timeout"])
 async def test_instagram_carousel_post(initiative_id, media_urls_list):
     """Test posting a carousel to Instagram with multiple generated images"""
     logger.info("Starting Instagram carousel post test...")
     
-    result = await instagram_image_post_tool._arun(
-        initiative_id=initiative_id,
-        caption="Amazing AI-generated carousel! Swipe to see more 🎨",
-        tags=["carousel", "aiart", "creativity"],
-        image_prompts=[
-            "Abstract geometric art with vibrant neon colors",
-            "Minimalist zen garden with perfect symmetry",
-            "Futuristic cityscape with flying vehicles"
-        ],
-        is_carousel=True,
-        metadata={"test_type": "carousel"}
-    )
+    result = await InstagramExecutor(initiative_id).execute({
+        "post_id": "test_ig_carousel",
+        "post_type": "carousel",
+        "content": {
+            "caption": "Amazing AI-generated carousel! Swipe to see more 🎨",
+            "hashtags": ["carousel", "aiart", "creativity"]
+        },
+        "media": [
+            {"url": "Abstract geometric art with vibrant neon colors"},
+            {"url": "Minimalist zen garden with perfect symmetry"},
+            {"url": "Futuristic cityscape with flying vehicles"}
+        ]
+    })
     
     logger.debug(f"Post result: {result}")
     assert result.success is True, f"Post should succeed: {result.error_message}"
-    assert result.status == PostStatus.PUBLISHED
-    assert len(result.media_files) == 3
+    assert result.status == PostingStatus.PUBLISHED
+    assert len(result.media_urls) == 3
     
-    logger.info(f"✅ Successfully posted carousel to Instagram: {result.post_url}")
-    media_urls_list.extend([mf.public_url for mf in result.media_files])
+    logger.info(f"✅ Successfully posted carousel to Instagram: {result.platform_url}")
+    media_urls_list.extend(result.media_urls)
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"] * 2 + TEST_CONFIG["posting_timeout"])
 async def test_instagram_reel_post(initiative_id, media_urls_list):
     """Test posting a Reel to Instagram with generated video"""
     logger.info("Starting Instagram Reel post test...")
     
-    result = await instagram_reel_post_tool._arun(
-        initiative_id=initiative_id,
-        caption="AI-generated Reel with Wavespeed! 🎬",
-        tags=["reels", "aivideo", "wavespeed"],
-        video_prompt="Dynamic animation of colorful abstract shapes morphing and flowing",
-        duration_seconds=5,
-        cover_image_prompt="Vibrant abstract art thumbnail with bold colors",
-        metadata={"format": "reel", "ai_generated": True}
-    )
+    result = await InstagramExecutor(initiative_id).execute({
+        "post_id": "test_ig_reel",
+        "post_type": "reel",
+        "content": {
+            "caption": "AI-generated Reel with Wavespeed! 🎬",
+            "hashtags": ["reels", "aivideo", "wavespeed"]
+        },
+        "media": [{
+            "url": "Dynamic animation of colorful abstract shapes morphing and flowing",
+            "duration_seconds": 5
+        }]
+    })
     
     logger.debug(f"Post result: {result}")
     assert result.success is True, f"Post should succeed: {result.error_message}"
-    assert result.status == PostStatus.PUBLISHED
-    assert any(mf.file_type == "reel" for mf in result.media_files)
+    assert result.status == PostingStatus.PUBLISHED
+    assert result.media_urls, "Reel should include the generated video"
     
-    logger.info(f"✅ Successfully posted Reel to Instagram: {result.post_url}")
-    media_urls_list.extend([mf.public_url for mf in result.media_files])
+    logger.info(f"✅ Successfully posted Reel to Instagram: {result.platform_url}")
+    media_urls_list.extend(result.media_urls)
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["posting_timeout"])
 async def test_facebook_text_link_post(initiative_id):
     """Test posting text with link to Facebook"""
     logger.info("Starting Facebook text+link post test...")
     
-    result = await facebook_text_link_post_tool._arun(
-        initiative_id=initiative_id,
-        caption="Check out the latest in AI-powered content creation!",
-        tags=["AI", "automation", "technology"],
-        link_url="https://example.com/ai-content-creation",
-        metadata={"content_type": "article"}
-    )
+    result = await FacebookExecutor(initiative_id).execute({
+        "post_id": "test_fb_link",
+        "post_type": "link",
+        "content": {
+            "caption": "Check out the latest in AI-powered content creation!",
+            "hashtags": ["AI", "automation", "technology"],
+            "links": ["https://example.com/ai-content-creation"]
+        }
+    })
     
     logger.debug(f"Post result: {result}")
     assert result.success is True, f"Post should succeed: {result.error_message}"
-    assert result.status == PostStatus.PUBLISHED
+    assert result.status == PostingStatus.PUBLISHED
     assert result.platform == "facebook"
     
-    logger.info(f"✅ Successfully posted to Facebook: {result.post_id}")
+    logger.info(f"✅ Successfully posted to Facebook: {result.platform_post_id}")
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"] + TEST_CONFIG["posting_timeout"])
 async def test_facebook_image_post(initiative_id, media_urls_list):
     """Test posting an image to Facebook with generation"""
     logger.info("Starting Facebook image post test...")
     
-    result = await facebook_image_post_tool._arun(
-        initiative_id=initiative_id,
-        caption="Beautiful AI art created with Wavespeed! 🎨",
-        tags=["aiart", "digitalart", "wavespeed"],
-        image_prompts=["Impressionist painting of a peaceful garden with blooming flowers"],
-        is_album=False,
-        metadata={"art_style": "impressionist"}
-    )
+    result = await FacebookExecutor(initiative_id).execute({
+        "post_id": "test_fb_image",
+        "post_type": "image",
+        "content": {
+            "caption": "Beautiful AI art created with Wavespeed! 🎨",
+            "hashtags": ["aiart", "digitalart", "wavespeed"]
+        },
+        "media": [{"url": "Impressionist painting of a peaceful garden with blooming flowers"}]
+    })
     
     logger.debug(f"Post result: {result}")
     assert result.success is True, f"Post should succeed: {result.error_message}"
-    assert result.status == PostStatus.PUBLISHED
-    assert len(result.media_files) == 1
+    assert result.status == PostingStatus.PUBLISHED
+    assert len(result.media_urls) == 1
     
-    logger.info(f"✅ Successfully posted image to Facebook: {result.post_id}")
-    media_urls_list.extend([mf.public_url for mf in result.media_files])
+    logger.info(f"✅ Successfully posted image to Facebook: {result.platform_post_id}")
+    media_urls_list.extend(result.media_urls)
 
 
+@slow
 @pytest.mark.asyncio
 @pytest.mark.timeout(TEST_CONFIG["generation_timeout"] * 2 + TEST_CONFIG["posting_timeout"])
 async def test_facebook_video_post(initiative_id, media_urls_list):
     """Test posting a video to Facebook with generation"""
     logger.info("Starting Facebook video post test...")
     
-    result = await facebook_video_post_tool._arun(
-        initiative_id=initiative_id,
-        caption="Incredible AI-generated video with Wavespeed! 🎥",
-        tags=["video", "aigenerated", "innovation"],
-        video_prompt="Smooth animation of liquid metal transforming into geometric shapes",
-        duration_seconds=5,
-        video_title="AI Video Generation Demo",
-        metadata={"video_type": "animation"}
-    )
+    result = await FacebookExecutor(initiative_id).execute({
+        "post_id": "test_fb_video",
+        "post_type": "video",
+        "content": {
+            "caption": "Incredible AI-generated video with Wavespeed! 🎥",
+            "hashtags": ["video", "aigenerated", "innovation"]
+        },
+        "media": [{
+            "url": "Smooth animation of liquid metal transforming into geometric shapes",
+            "duration_seconds": 5
+        }]
+    })
     
     logger.debug(f"Post result: {result}")
     assert result.success is True, f"Post should succeed: {result.error_message}"
-    assert result.status == PostStatus.PUBLISHED
-    assert any(mf.file_type == "video" for mf in result.media_files)
+    assert result.status == PostingStatus.PUBLISHED
+    assert result.media_urls, "Post should include the generated video"
     
-    logger.info(f"✅ Successfully posted video to Facebook: {result.post_id}")
-    media_urls_list.extend([mf.public_url for mf in result.media_files])
+    logger.info(f"✅ Successfully posted video to Facebook: {result.platform_post_id}")
+    media_urls_list.extend(result.media_urls)
 
 
 @pytest.mark.asyncio
@@ -334,16 +391,16 @@ async def test_error_handling_invalid_initiative():
     invalid_id = "00000000-0000-0000-0000-000000000000"
     
     logger.info("Testing error handling with invalid initiative...")
-    result = await instagram_image_post_tool._arun(
-        initiative_id=invalid_id,
-        caption="This should fail",
-        tags=["test"],
-        image_prompts=["Test prompt"],
-        is_carousel=False
-    )
+    # Tokens are looked up before any media is generated, so this fails fast
+    result = await InstagramExecutor(invalid_id).execute({
+        "post_id": "test_invalid_initiative",
+        "post_type": "image",
+        "content": {"caption": "This should fail", "hashtags": ["test"]},
+        "media": [{"url": "Test prompt"}]
+    })
     
     assert result.success is False
-    assert result.status == PostStatus.FAILED
+    assert result.status == PostingStatus.FAILED
     assert result.error_message is not None
     logger.info(f"✅ Error handled correctly: {result.error_message}")
 
@@ -354,6 +411,8 @@ def main():
     parser.add_argument('--test', choices=['all', 'image', 'video', 'instagram', 'facebook', 'existing-video'],
                         default='all', help='Which tests to run')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--concurrency', type=int, default=3,
+                        help='Max tests running at once (caps simultaneous posts to the test accounts)')
     args = parser.parse_args()
     
     # Set logging level
@@ -403,44 +462,61 @@ def main():
     elif args.test == 'existing-video':
         test_functions = [test_with_existing_video]
     
-    # Run tests
+    # Run tests concurrently: each one waits on independent network calls
     async def run_tests():
         initiative_id = str(TEST_INITIATIVE_ID)
         media_urls = []
+        fixtures = {
+            "initiative_id": initiative_id,
+            "media_urls_list": media_urls
+        }
+        # Services are built on first use and shared, like the session fixtures
+        services = {
+            "image_service": ImageGenerationService,
+            "video_service": VideoGenerationService
+        }
+        
+        def fixture(name):
+            if name not in fixtures:
+                fixtures[name] = services[name]()
+            return fixtures[name]
+        semaphore = asyncio.Semaphore(max(1, args.concurrency))
+        
+        async def run_test(test_func) -> bool:
+            async with semaphore:
+                logger.info(f"▶️  Running: {test_func.__name__}")
+                try:
+                    # Pass only the fixtures the test asks for
+                    params = inspect.signature(test_func).parameters
+                    await test_func(**{name: fixture(name) for name in params})
+                    logger.info(f"✅ {test_func.__name__} PASSED")
+                    return True
+                except Exception as e:
+                    logger.error(f"❌ {test_func.__name__} FAILED: {e}")
+                    if args.verbose:
+                        import traceback
+                        traceback.print_exc()
+                    return False
         
-        for test_func in test_functions:
-            try:
-                logger.info(f"\n{'='*60}")
-                logger.info(f"Running: {test_func.__name__}")
-                logger.info(f"{'='*60}")
-                
-                # Check if test needs media_urls_list fixture
-                if 'media_urls_list' in test_func.__code__.co_varnames:
-                    await test_func(initiative_id, media_urls)
-                else:
-                    await test_func(initiative_id)
-                
-                logger.info(f"✅ {test_func.__name__} PASSED")
-            except Exception as e:
-                logger.error(f"❌ {test_func.__name__} FAILED: {e}")
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc()
+        results = await asyncio.gather(*(run_test(test_func) for test_func in test_functions))
         
         logger.info(f"\n{'='*60}")
-        logger.info(f"Test run complete. Generated media URLs:")
+        logger.info(f"Test run complete: {sum(results)}/{len(results)} passed. Generated media URLs:")
         for url in media_urls:
             logger.info(f"  - {url}")
     
-    # Run async tests
+    # Run async tests, on uvloop's faster event loop when it is installed
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(run_tests())
 
 
 if __name__ == "__main__":
-    # Check if running with pytest or as script
-    if 'pytest' in sys.modules:
-        # Running with pytest, don't execute main
-        pass
-    else:
-        # Running as script
-        main()
\ No newline at end of file
+    # pytest imports this module under its own name, so reaching here
+    # always means it was run as a script. (Checking sys.modules for
+    # pytest never ran main: the module imports pytest itself.)
+    main()
\ No newline at end of file
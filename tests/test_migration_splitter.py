@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# tests/test_migration_splitter.py
+
+"""
+Tests for splitting migration files into statements.
+Runs offline; no database connection is opened.
+
+Usage:
+    pytest tests/test_migration_splitter.py -v
+"""
+
+import re
+import sys
+from pathlib import Path
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from scripts.setup.run_migrations import DOLLAR_QUOTE_RE, MigrationRunner
+
+split = MigrationRunner.split_sql_statements
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "backend" / "db" / "migrations"
+
+# Comments in the shipped migrations, which may contain apostrophes
+COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "migration",
+    sorted(MIGRATIONS_DIR.glob("*.sql")),
+    ids=lambda path: path.stem
+)
+def test_existing_migrations_split_outside_quotes(migration):
+    """No statement of a shipped migration is cut inside a string or body"""
+    statements = split(migration.read_text())
+
+    assert statements
+    for statement in statements:
+        assert COMMENT_RE.sub("", statement).count("'") % 2 == 0, statement
+        tags = DOLLAR_QUOTE_RE.findall(statement)
+        for tag in set(tags):
+            assert tags.count(tag) % 2 == 0, statement
+
+
+def test_plain_statements():
+    assert split("SELECT 1;\nSELECT 2;\n-- done\n") == ["SELECT 1;", "SELECT 2;"]
+
+
+def test_semicolons_in_strings_comments_and_bodies():
+    sql = (
+        "INSERT INTO t VALUES ('a;b', 'it''s;');\n"
+        "/* ; */ CREATE FUNCTION f() RETURNS void AS $body$ BEGIN; END; $body$ LANGUAGE plpgsql;\n"
+        "SELECT 3"
+    )
+    assert split(sql) == [
+        "INSERT INTO t VALUES ('a;b', 'it''s;');",
+        "/* ; */ CREATE FUNCTION f() RETURNS void AS $body$ BEGIN; END; $body$ LANGUAGE plpgsql;",
+        "SELECT 3",
+    ]
+
+
+def test_escape_string_backslash_quote():
+    """E'\\'' is a single quote, not the end of the string"""
+    sql = "SELECT E'it\\'s; fine', e'\\\\';\nSELECT 2;"
+    assert split(sql) == ["SELECT E'it\\'s; fine', e'\\\\';", "SELECT 2;"]
+
+
+def test_backslash_is_literal_in_standard_strings():
+    """Only E'...' strings treat backslashes as escapes"""
+    sql = "SELECT 'C:\\';\nSELECT 1 FROM t WHERE path LIKE'\\';"
+    assert split(sql) == ["SELECT 'C:\\';", "SELECT 1 FROM t WHERE path LIKE'\\';"]
+
+
+def test_nested_block_comment():
+    sql = "SELECT 1 /* outer /* inner; */ still; comment */;\nSELECT 2;"
+    assert split(sql) == [
+        "SELECT 1 /* outer /* inner; */ still; comment */;",
+        "SELECT 2;",
+    ]
+
+
+def test_comment_only_input():
+    assert split("-- nothing\n/* here; /* at */ all */\n") == []
@@ -0,0 +1,79 @@
+# tests/test_transient_retry.py
+
+"""
+Tests for retrying transient database failures.
+Uses a stand-in PostgREST query, so no Supabase project is needed.
+
+Usage:
+    pytest tests/test_transient_retry.py -v
+"""
+
+import sys
+from pathlib import Path
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("supabase")
+pytest.importorskip("tenacity")
+
+import httpx
+from tenacity import wait_none
+
+from backend.db import supabase_client
+
+
+class FlakyQuery:
+    """Query whose execute() raises the given errors, then returns a result"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "result"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry immediately instead of sleeping between attempts"""
+    monkeypatch.setattr(supabase_client, "RETRY_WAIT", wait_none())
+
+
+@pytest.mark.asyncio
+async def test_read_retried_after_transient_failure():
+    """A dropped connection on a read is retried until it succeeds"""
+    query = FlakyQuery(httpx.ConnectError("connection reset"), httpx.ReadTimeout("timed out"))
+
+    result = await supabase_client._execute(query)
+
+    assert result == "result"
+    assert query.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_read_gives_up_after_max_attempts():
+    """Persistent transient failures are re-raised after the last attempt"""
+    errors = [httpx.ConnectError("down")] * supabase_client.RETRY_ATTEMPTS
+    query = FlakyQuery(*errors)
+
+    with pytest.raises(httpx.ConnectError):
+        await supabase_client._execute(query)
+    assert query.calls == supabase_client.RETRY_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_write_retried_only_when_request_never_sent():
+    """Writes retry connect failures but not timeouts that may have applied"""
+    query = FlakyQuery(httpx.ConnectError("refused"))
+    assert await supabase_client._execute(query, retry_on=supabase_client.WRITE_RETRY_ERRORS) == "result"
+    assert query.calls == 2
+
+    query = FlakyQuery(httpx.ReadTimeout("timed out"))
+    with pytest.raises(httpx.ReadTimeout):
+        await supabase_client._execute(query, retry_on=supabase_client.WRITE_RETRY_ERRORS)
+    assert query.calls == 1